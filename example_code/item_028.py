@@ -190,3 +190,363 @@ handle.seek(0)
 image_data = handle.read()
 print(pictures)
 print(image_data)
+
+
+print("Example 6")
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+def default_max_handles():
+    try:
+        import resource
+    except ImportError:  # 윈도우에는 resource 모듈이 없음
+        return 256
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return 4096
+    # 다른 코드가 쓸 파일 디스크립터를 위해 절반만 사용함
+    return max(16, soft // 2)
+
+class LRUPictures(OrderedDict):
+    def __init__(self, maxsize=None):
+        super().__init__()
+        self.maxsize = maxsize or default_max_handles()
+        self.pins = Counter()
+        self.lock = threading.RLock()  # 조회+고정과 축출을 원자적으로 수행함
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        with self.lock:
+            if key in self:
+                self.hits += 1
+                self.move_to_end(key)
+                return super().__getitem__(key)
+            return self.__missing__(key)
+
+    def __missing__(self, key):
+        with self.lock:
+            self.misses += 1
+            value = open_picture(key)
+            self[key] = value
+            self.evict(keep=key)  # 방금 연 핸들을 바로 닫지 않도록 함
+            return value
+
+    def evict(self, keep=None):
+        # 가장 오래 사용하지 않은 핸들부터 닫되, 고정된 핸들은 건너뜀
+        with self.lock:
+            while len(self) > self.maxsize:
+                for victim in self:
+                    if victim != keep and not self.pins[victim]:
+                        break
+                else:
+                    break  # 모두 고정되어 있으면 잠시 한도를 넘김
+                self.pop(victim).close()
+                self.evictions += 1
+
+    @contextmanager
+    def pinned(self, key):
+        with self.lock:
+            handle = self[key]
+            self.pins[key] += 1
+        try:
+            yield handle
+        finally:
+            with self.lock:
+                self.pins[key] -= 1
+                if not self.pins[key]:
+                    del self.pins[key]
+                self.evict()
+
+    def read(self, key):
+        with self.pinned(key) as handle:
+            if not hasattr(os, "pread"):
+                handle.seek(0)
+                return handle.read()
+            # pread는 공유 파일 위치를 바꾸지 않으므로 동시에 읽어도 안전함
+            fd = handle.fileno()
+            chunks = []
+            offset = 0
+            while chunk := os.pread(fd, 65536, offset):
+                chunks.append(chunk)
+                offset += len(chunk)
+            return b"".join(chunks)
+
+    def close(self):
+        with self.lock:
+            while self:
+                self.popitem(last=False)[1].close()
+
+
+print("Example 7")
+pictures = LRUPictures(maxsize=2)
+for i in range(3):
+    with open(f"profile_{i}.png", "wb") as f:
+        f.write(f"image data here {i}".encode())
+
+print(pictures.read("profile_0.png"))
+with pictures.pinned("profile_1.png"):
+    pictures.read("profile_2.png")  # profile_0을 축출함
+    pictures.read("profile_0.png")  # profile_1은 고정되어 있으므로 profile_2를 축출함
+print(list(pictures))
+print(pictures.hits, pictures.misses, pictures.evictions)
+assert "profile_1.png" in pictures
+pictures.close()
+
+single = LRUPictures(maxsize=1)
+with single.pinned("profile_0.png"):
+    # 유일한 핸들이 고정되어 있어도 새로 연 핸들은 읽기 전에 닫히지 않음
+    print(single.read("profile_1.png"))
+assert len(single) == 1  # 고정이 풀린 뒤 한도를 다시 지킴
+single.close()
+
+
+print("Example 8")
+import time
+
+path_count = 500
+paths = [f"zipf_{i}.png" for i in range(path_count)]
+for i, path in enumerate(paths):
+    with open(path, "wb") as f:
+        f.write(os.urandom(256))
+
+weights = [1 / (rank + 1) for rank in range(path_count)]  # 지프 분포
+accesses = random.choices(paths, weights=weights, k=50_000)
+
+def benchmark(pictures, read):
+    start = time.perf_counter()
+    for path in accesses:
+        read(pictures, path)
+    return time.perf_counter() - start
+
+def read_unbounded(pictures, path):
+    handle = pictures[path]
+    handle.seek(0)
+    return handle.read()
+
+unbounded = Pictures()
+unbounded_time = benchmark(unbounded, read_unbounded)
+print(f"무제한:  {unbounded_time:.3f}초, 열린 핸들 {len(unbounded)}개")
+for handle in unbounded.values():
+    handle.close()
+
+lru = LRUPictures(maxsize=64)
+lru_time = benchmark(lru, LRUPictures.read)
+hit_rate = lru.hits / (lru.hits + lru.misses)
+print(f"LRU:     {lru_time:.3f}초, 열린 핸들 {len(lru)}개, "
+      f"적중률 {hit_rate:.1%}, 축출 {lru.evictions}회")
+lru.close()
+
+# 여러 스레드가 작은 캐시를 공유해도 닫힌 핸들을 읽지 않음
+shared = LRUPictures(maxsize=4)
+
+def concurrent_reader(offset):
+    for path in accesses[offset:offset + 2000]:
+        shared.read(path)
+
+readers = [
+    threading.Thread(target=concurrent_reader, args=(i * 2000,))
+    for i in range(8)
+]
+for reader in readers:
+    reader.start()
+for reader in readers:
+    reader.join()
+assert len(shared) <= 4 and not shared.pins
+shared.close()
+
+
+print("Example 9")
+import copy
+from concurrent.futures import Future
+
+class SingleFlightPictures(dict):
+    def __init__(self, loader=open_picture, negative_ttl=1.0):
+        super().__init__()
+        self.loader = loader
+        self.negative_ttl = negative_ttl
+        self.lock = threading.Lock()  # 딕셔너리 갱신에만 잠깐 사용함
+        self.in_flight = {}           # 키 -> 로딩 중인 Future
+        self.failures = {}            # 키 -> (예외, 만료 시각)
+
+    def __missing__(self, key):
+        with self.lock:
+            if key in self:  # 락을 기다리는 동안 다른 스레드가 로딩을 마침
+                return dict.__getitem__(self, key)
+            failure = self.failures.get(key)
+            if failure is not None:
+                error, expires = failure
+                if time.monotonic() < expires:
+                    # 저장한 예외를 그대로 다시 던지면 호출마다 트레이스백이
+                    # 쌓이고 스레드끼리 같은 객체를 공유하므로 복사본을 던짐
+                    raise copy.copy(error)
+                del self.failures[key]
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.in_flight[key] = future
+
+        if not owner:
+            return future.result()  # 같은 키를 로딩하는 스레드만 기다림
+
+        try:
+            value = self.loader(key)
+        except BaseException as e:
+            # 어떤 예외든 대기 중인 스레드를 깨워야 영원히 막히지 않음
+            with self.lock:
+                if isinstance(e, OSError):  # 부정 캐시는 OSError에만 적용함
+                    expires = time.monotonic() + self.negative_ttl
+                    self.failures[key] = (copy.copy(e), expires)
+                del self.in_flight[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            self[key] = value
+            del self.in_flight[key]
+        future.set_result(value)
+        return value
+
+
+print("Example 10")
+import asyncio
+
+class AsyncSingleFlightPictures(dict):
+    def __init__(self, loader=open_picture, negative_ttl=1.0):
+        super().__init__()
+        self.loader = loader
+        self.negative_ttl = negative_ttl
+        self.in_flight = {}
+        self.failures = {}
+
+    async def get(self, key):
+        # 이벤트 루프 스레드에서만 호출되므로 await 사이에는 락이 필요 없음
+        if key in self:
+            return self[key]
+        failure = self.failures.get(key)
+        if failure is not None:
+            error, expires = failure
+            if time.monotonic() < expires:
+                raise copy.copy(error)  # 새 트레이스백을 가진 복사본
+            del self.failures[key]
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.load(key))
+            self.in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def load(self, key):
+        try:
+            value = await asyncio.to_thread(self.loader, key)
+        except OSError as e:
+            expires = time.monotonic() + self.negative_ttl
+            self.failures[key] = (copy.copy(e), expires)
+            raise
+        else:
+            self[key] = value
+            return value
+        finally:
+            del self.in_flight[key]
+
+
+print("Example 11")
+open_count = 0
+open_count_lock = threading.Lock()
+
+def slow_open_picture(profile_path):
+    global open_count
+    with open_count_lock:
+        open_count += 1
+    time.sleep(0.01)  # 느린 저장 장치를 흉내 냄
+    return open(profile_path, "rb")
+
+class NaivePictures(dict):
+    def __missing__(self, key):
+        value = slow_open_picture(key)
+        self[key] = value
+        return value
+
+def stress(pictures, thread_count=64, rounds=20):
+    global open_count
+    open_count = 0
+    hot_paths = paths[:4]
+    barrier = threading.Barrier(thread_count)
+
+    def worker(index):
+        barrier.wait()
+        for i in range(rounds):
+            pictures[hot_paths[(index + i) % len(hot_paths)]]
+
+    threads = [
+        threading.Thread(target=worker, args=(i,))
+        for i in range(thread_count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for handle in pictures.values():
+        handle.close()
+    return open_count
+
+print("단순 캐시의 open 횟수:    ", stress(NaivePictures()))
+single_flight_opens = stress(SingleFlightPictures(slow_open_picture))
+print("단일 비행 캐시의 open 횟수:", single_flight_opens)
+assert single_flight_opens == 4
+
+def broken_loader(profile_path):
+    time.sleep(0.05)
+    raise ValueError(profile_path)
+
+broken = SingleFlightPictures(broken_loader)
+errors = []
+
+def broken_worker():
+    try:
+        broken["손상됨.png"]
+    except ValueError as e:
+        errors.append(e)
+
+threads = [threading.Thread(target=broken_worker) for _ in range(2)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join(timeout=2)
+assert len(errors) == 2  # 대기하던 스레드도 같은 예외를 받음
+assert not broken.in_flight and not broken.failures
+
+
+print("Example 12")
+import traceback
+
+def missing_loader(profile_path):
+    global open_count
+    open_count += 1
+    return open(profile_path, "rb")
+
+async def load_many():
+    pictures = AsyncSingleFlightPictures(missing_loader)
+    handles = await asyncio.gather(
+        *(pictures.get(paths[i % 2]) for i in range(100))
+    )
+    errors = []
+    for _ in range(3):
+        try:
+            await pictures.get("존재하지 않음.png")
+        except OSError as e:
+            errors.append(e)  # 두 번째부터는 음성 캐시에서 바로 실패함
+    # 캐시된 실패도 호출마다 새 예외라서 트레이스백이 쌓이지 않음
+    assert errors[1] is not errors[2]
+    assert len(traceback.extract_tb(errors[1].__traceback__)) == len(
+        traceback.extract_tb(errors[2].__traceback__)
+    )
+    assert errors[2].filename == "존재하지 않음.png"
+    for handle in pictures.values():
+        handle.close()
+    return len(handles)
+
+open_count = 0
+print(asyncio.run(load_many()), "번 요청, open 호출", open_count, "번")
+assert open_count == 3
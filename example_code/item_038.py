@@ -131,3 +131,143 @@ help(fibonacci)
 
 print("Example 10")
 print(pickle.dumps(fibonacci))
+
+
+print("Example 11")
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "currsize"]
+)
+
+KWARGS_MARK = object()  # 위치 인자와 키워드 인자 사이의 구분자
+
+def make_key(args, kwargs, key_funcs):
+    if key_funcs:
+        args = tuple(
+            key_funcs[i](arg) if i in key_funcs else arg
+            for i, arg in enumerate(args)
+        )
+        kwargs = {
+            name: key_funcs[name](value) if name in key_funcs else value
+            for name, value in kwargs.items()
+        }
+    if kwargs:
+        # 구분자가 없으면 f(("a", 1))과 f(a=1)의 키가 같아짐
+        return args + (KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return args
+
+def trace_memo(maxsize=128, ttl=None, key_funcs=None):
+    # key_funcs: 인자 위치(int)나 키워드 이름(str) -> 캐시 키 변환 함수
+    def decorator(func):
+        cache = OrderedDict()  # 키 -> (결과, 만료 시각)
+        stats = [0, 0, 0]      # 적중, 실패, 축출
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs, key_funcs)
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and (ttl is None or entry[1] > now):
+                stats[0] += 1
+                cache.move_to_end(key)
+                result = entry[0]
+                source = "캐시"
+            else:
+                if entry is not None:  # TTL이 지난 항목
+                    del cache[key]
+                    stats[2] += 1
+                stats[1] += 1
+                result = func(*args, **kwargs)
+                expires = None if ttl is None else now + ttl
+                cache[key] = (result, expires)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats[2] += 1
+                source = "계산"
+            print(f"{func.__name__}({args!r}, {kwargs!r}) "
+                  f"-> {result!r} [{source}]")
+            return result
+
+        def cache_info():
+            return CacheInfo(*stats, len(cache))
+
+        def cache_clear():
+            cache.clear()
+            stats[:] = [0, 0, 0]
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+print("Example 12")
+@trace_memo(maxsize=16)
+def fibonacci(n):
+    """n 번째 피보나치 수를 반환함"""
+    if n in (0, 1):
+        return n
+    return fibonacci(n - 2) + fibonacci(n - 1)
+
+fibonacci(4)
+print(fibonacci.cache_info())
+print(pickle.dumps(fibonacci))
+
+
+print("Example 13")
+@trace_memo(maxsize=2, ttl=60, key_funcs={0: str.lower})
+def lookup(name):
+    return len(name)
+
+lookup("Hello")
+lookup("HELLO")  # 키 함수 덕분에 캐시 적중
+lookup("a")
+lookup("b")      # maxsize를 넘으므로 가장 오래된 항목을 축출
+print(lookup.cache_info())
+assert lookup.cache_info() == CacheInfo(1, 3, 1, 2)
+assert make_key((("a", 1),), {}, None) != make_key((), {"a": 1}, None)
+
+
+print("Example 14")
+import contextlib
+import io
+import timeit
+
+@trace
+def naive_fibonacci(n):
+    if n in (0, 1):
+        return n
+    return naive_fibonacci(n - 2) + naive_fibonacci(n - 1)
+
+@trace_memo(maxsize=None)
+def memo_fibonacci(n):
+    if n in (0, 1):
+        return n
+    return memo_fibonacci(n - 2) + memo_fibonacci(n - 1)
+
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def untraced_fibonacci(n):
+    if n in (0, 1):
+        return n
+    return untraced_fibonacci(n - 2) + untraced_fibonacci(n - 1)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    naive_time = timeit.timeit(lambda: naive_fibonacci(18), number=1)
+
+    def cold_memo():
+        memo_fibonacci.cache_clear()
+        return memo_fibonacci(18)
+
+    memo_time = timeit.timeit(cold_memo, number=1)
+    hot_time = timeit.timeit(lambda: memo_fibonacci(18), number=1000)
+untraced_time = timeit.timeit(lambda: untraced_fibonacci(18), number=1000)
+
+print(f"추적 + 단순 재귀:   {naive_time * 1e3:8.3f}ms")
+print(f"추적 + 메모(콜드):  {memo_time * 1e3:8.3f}ms")
+print(f"추적 + 메모(핫):    {hot_time * 1e3:8.3f}us/호출")
+print(f"lru_cache(핫):      {untraced_time * 1e3:8.3f}us/호출")
@@ -86,3 +86,120 @@ def animate_composed():
     yield from move(2, 3.0)
 
 run(animate_composed)
+
+
+print("Example 5")
+import itertools
+
+FAST_STAGES = {}  # 제너레이터 함수 -> 같은 값을 내놓는 C 이터레이터 팩토리
+
+def fast_stage(generator_func):
+    def decorator(fast_func):
+        FAST_STAGES[generator_func] = fast_func
+        return fast_func
+    return decorator
+
+@fast_stage(move)
+def move_fast(period, speed):
+    return itertools.repeat(speed, period)
+
+@fast_stage(pause)
+def pause_fast(delay):
+    return itertools.repeat(0, delay)
+
+
+print("Example 6")
+class Pipeline:
+    def __init__(self, *stages):
+        # 중첩된 파이프라인을 (함수, 인자) 단계의 평평한 목록으로 펼침
+        self.stages = []
+        for stage in stages:
+            if isinstance(stage, Pipeline):
+                self.stages.extend(stage.stages)
+            else:
+                func, *args = stage
+                self.stages.append((func, args))
+
+    def __iter__(self):
+        # send()/throw()가 필요 없으면 파이썬 프레임 없이 C 수준에서 이어 붙임
+        return itertools.chain.from_iterable(
+            FAST_STAGES.get(func, func)(*args)
+            for func, args in self.stages
+        )
+
+    def driver(self):
+        # send()/throw()를 현재 단계에 전달하는 제너레이터 (깊이 1).
+        # 대체 이터레이터는 send()를 지원하지 않으므로 원래 제너레이터를 씀
+        for func, args in self.stages:
+            yield from func(*args)
+
+    def batches(self, size):
+        it = iter(self)
+        while batch := list(itertools.islice(it, size)):
+            yield batch
+
+animation = Pipeline((move, 4, 5.0), (pause, 3), (move, 2, 3.0))
+assert list(animation) == list(animate_composed())
+run(lambda: animation)
+print(list(animation.batches(4)))
+
+
+print("Example 7")
+class Reset(Exception):
+    pass
+
+def timer(period):  # 아이템 47의 timer
+    current = period
+    while current:
+        try:
+            yield current
+        except Reset:
+            print("재설정")
+            current = period
+        else:
+            current -= 1
+
+it = Pipeline((timer, 3), Pipeline((pause, 1), (timer, 2))).driver()
+print(next(it), next(it))
+print(it.throw(Reset()))  # 실행 중인 timer 단계가 예외를 받음
+print(list(it))
+
+it = Pipeline((move, 2, 5.0)).driver()
+print(next(it), it.send(5))  # move 제너레이터처럼 보낸 값을 무시함
+
+
+print("Example 8")
+import time
+
+def nested(depth):
+    if depth == 0:
+        yield from animate_composed_long()
+    else:
+        yield from nested(depth - 1)
+
+def animate_composed_long():
+    for _ in range(1000):
+        yield from move(40, 5.0)
+        yield from pause(30)
+        yield from move(20, 3.0)
+
+def nested_pipeline(depth):
+    pipeline = Pipeline(
+        *[Pipeline((move, 40, 5.0), (pause, 30), (move, 20, 3.0))] * 1000
+    )
+    for _ in range(depth):
+        pipeline = Pipeline(pipeline)
+    return pipeline
+
+def measure(make_iterable):
+    start = time.perf_counter()
+    count = sum(1 for _ in make_iterable())
+    return count / (time.perf_counter() - start)
+
+for depth in (0, 8, 32):
+    nested_rate = measure(lambda: nested(depth))
+    driver_rate = measure(lambda: nested_pipeline(depth).driver())
+    fused_rate = measure(lambda: nested_pipeline(depth))
+    print(f"깊이 {depth:2}: 중첩 {nested_rate:12,.0f}/초, "
+          f"드라이버 {driver_rate:12,.0f}/초, "
+          f"융합 {fused_rate:12,.0f}/초")
@@ -169,3 +169,186 @@ def run_cascading():
         transmit(output)
 
 run_cascading()
+
+
+print("Example 12")
+from array import array
+from collections import OrderedDict
+from itertools import islice
+
+class SineBlockCache:
+    # 항목 수가 아니라 바이트 수로 크기를 제한하는 LRU 캐시
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.blocks = OrderedDict()  # (steps, start, size) -> array("d")
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, steps, start, size):
+        key = (steps, start, size)
+        block = self.blocks.get(key)
+        if block is not None:
+            self.hits += 1
+            self.blocks.move_to_end(key)
+            return block
+        self.misses += 1
+        # 블록이 필요할 때 그 구간만 계산하므로 긴 파형도 메모리는 O(블록)임
+        step_size = 2 * math.pi / steps
+        sin = math.sin
+        block = array("d", [
+            sin(step * step_size) for step in range(start, start + size)
+        ])
+        block_bytes = block.itemsize * len(block)
+        if block_bytes <= self.max_bytes:
+            self.blocks[key] = block
+            self.nbytes += block_bytes
+            while self.nbytes > self.max_bytes:
+                _, old = self.blocks.popitem(last=False)
+                self.nbytes -= old.itemsize * len(old)
+        return block
+
+    def clear(self):
+        self.blocks.clear()
+        self.nbytes = self.hits = self.misses = 0
+
+sine_cache = SineBlockCache(max_bytes=1 << 20)
+
+def sine_blocks(steps, block_size):
+    for start in range(0, steps, block_size):
+        yield sine_cache.get(steps, start, min(block_size, steps - start))
+
+def wave_blocks(amplitude, steps, block_size):
+    if steps * array("d").itemsize > sine_cache.max_bytes:
+        # 캐시에 다 들어가지 않는 긴 파형은 재사용할 일이 없으므로
+        # 캐시를 거치지 않고 sin과 진폭 곱셈을 한 번에 계산함
+        step_size = 2 * math.pi / steps
+        sin = math.sin
+        for start in range(0, steps, block_size):
+            stop = min(start + block_size, steps)
+            yield array("d", [
+                amplitude * sin(step * step_size)
+                for step in range(start, stop)
+            ])
+        return
+    for chunk in sine_blocks(steps, block_size):
+        yield array("d", [amplitude * x for x in chunk])
+
+
+print("Example 13")
+def run_blocks(it):
+    for block in it:
+        for output in block:
+            transmit(output)
+
+run_blocks(wave_blocks(3.0, 8, 3))
+
+
+print("Example 14")
+def wave_modulating_blocks(steps, block_size):
+    # 블록마다 block_size 이상의 길이를 가진 진폭 배열을 받는다
+    amplitudes = yield
+    for chunk in sine_blocks(steps, block_size):
+        if len(amplitudes) < len(chunk):
+            # zip은 짧은 쪽에 맞춰 조용히 잘라내므로 직접 검사함
+            raise ValueError(
+                f"진폭이 {len(chunk)}개 필요하지만 {len(amplitudes)}개를 받음"
+            )
+        output = array("d", [a * x for a, x in zip(amplitudes, chunk)])
+        amplitudes = yield output
+
+def wave_cascading_blocks(amplitude_it, steps, block_size):
+    # 샘플 단위 진폭 이터레이터에서 블록 크기만큼을 한꺼번에 꺼낸다
+    for chunk in sine_blocks(steps, block_size):
+        amplitudes = list(islice(amplitude_it, len(chunk)))
+        if len(amplitudes) < len(chunk):
+            # wave_cascading처럼 진폭이 모자라면 짧은 블록 대신 실패함
+            raise ValueError(
+                f"진폭이 {len(chunk)}개 필요하지만 {len(amplitudes)}개만 남음"
+            )
+        yield array("d", [a * x for a, x in zip(amplitudes, chunk)])
+
+def complex_wave_blocks(block_size):
+    yield from wave_blocks(7.0, 3, block_size)
+    yield from wave_blocks(2.0, 4, block_size)
+    yield from wave_blocks(10.0, 5, block_size)
+
+def complex_wave_cascading_blocks(amplitude_it, block_size):
+    yield from wave_cascading_blocks(amplitude_it, 3, block_size)
+    yield from wave_cascading_blocks(amplitude_it, 4, block_size)
+    yield from wave_cascading_blocks(amplitude_it, 5, block_size)
+
+expected = list(complex_wave())
+assert list(expected) == [
+    x for block in complex_wave_blocks(2) for x in block
+]
+
+amplitudes = [7, 7, 7, 2, 2, 2, 2, 10, 10, 10, 10, 10]
+expected = list(complex_wave_cascading(iter(amplitudes)))
+blocks = complex_wave_cascading_blocks(iter(amplitudes), 4)
+assert expected == [x for block in blocks for x in block]
+
+it = wave_modulating_blocks(12, 4)
+it.send(None)
+modulated = array("d")
+for amplitude in (7, 2, 10):
+    modulated.extend(it.send(array("d", [amplitude] * 4)))
+
+it = wave_modulating(12)
+it.send(None)
+expected = [it.send(a) for a in [7] * 4 + [2] * 4 + [10] * 4]
+assert list(modulated) == expected
+run_blocks([modulated])
+
+it = wave_modulating_blocks(12, 4)
+it.send(None)
+try:
+    it.send(array("d", [7, 7]))  # 블록 하나에 진폭 4개가 필요함
+except ValueError:
+    pass  # 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+try:
+    list(complex_wave_cascading_blocks(iter(amplitudes[:5]), 4))
+except ValueError:
+    pass  # 진폭이 모자라므로 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+
+print("Example 15")
+import time
+
+def samples_per_second(func, count):
+    start = time.perf_counter()
+    func(count)
+    return count / (time.perf_counter() - start)
+
+def consume_samples(count):
+    total = 0.0
+    for output in wave(3.0, count):
+        total += output
+    return total
+
+def consume_blocks(count):
+    total = 0.0
+    for block in wave_blocks(3.0, count, 4096):
+        total += sum(block)
+    return total
+
+count = 1_000_000
+per_sample = samples_per_second(consume_samples, count)
+sine_cache.clear()
+long_blocks = samples_per_second(consume_blocks, count)
+assert not sine_cache.blocks  # 긴 파형은 캐시를 채우지 않음
+# 캐시에 모두 들어가는 짧은 파형은 두 번째부터 sin을 다시 계산하지 않음
+short_count = 100_000
+cold_blocks = samples_per_second(consume_blocks, short_count)
+warm_blocks = samples_per_second(consume_blocks, short_count)
+assert sine_cache.nbytes <= sine_cache.max_bytes
+print(f"샘플 단위:          {per_sample:14,.0f} 샘플/초")
+print(f"블록 단위(긴 파형): {long_blocks:14,.0f} 샘플/초")
+print(f"블록 단위(콜드):    {cold_blocks:14,.0f} 샘플/초")
+print(f"블록 단위(캐시됨):  {warm_blocks:14,.0f} 샘플/초")
+print(f"캐시 크기:          {sine_cache.nbytes:14,} 바이트")
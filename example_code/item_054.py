@@ -181,3 +181,214 @@ serialized = """{
 deserialized = DatacenterRack.from_json(serialized)
 roundtrip = deserialized.to_json()
 assert json.loads(serialized) == json.loads(roundtrip)
+
+
+print("Example 10")
+LEAF, MIXIN, DICT, LIST, OBJECT = range(5)
+
+class IterativeToDictMixin:
+    # 값의 타입 -> 처리 방법. 같은 클래스의 인스턴스라도 속성마다 다른 타입을
+    # 담을 수 있으므로 "클래스별로 재귀가 필요한 속성" 대신 값의 타입별로
+    # 캐시해 isinstance 연쇄를 타입마다 한 번만 수행함
+    _kind_cache = {}
+    # 이 키의 값은 펼치지 않고 항상 _on_cycle로 넘김 (부모 같은 역참조)
+    _cycle_keys = frozenset()
+
+    @classmethod
+    def _kind_of(cls, value):
+        value_type = type(value)
+        kind = cls._kind_cache.get(value_type)
+        if kind is None:
+            if issubclass(value_type, (ToDictMixin, IterativeToDictMixin)):
+                kind = MIXIN
+            elif issubclass(value_type, dict):
+                kind = DICT
+            elif issubclass(value_type, list):
+                kind = LIST
+            elif hasattr(value, "__dict__"):
+                kind = OBJECT
+            else:
+                kind = LEAF
+            cls._kind_cache[value_type] = kind
+        return kind
+
+    def _on_cycle(self, key, value):
+        return None  # 순환 참조는 None으로 끊음
+
+    def to_dict(self):
+        kind_get = self._kind_cache.get
+        root = {}
+        active = set()  # 현재 경로에 있는 객체들 (순환 감지용)
+        # 스택 원소는 (키-값 쌍들, 출력 컨테이너, 리스트 여부, 객체 ID,
+        # 소유 객체, 소유 객체의 _cycle_keys) 프레임이거나, 하위 트리를
+        # 다 처리했을 때 active에서 빼낼 객체 ID(int)임. 소유 객체는 키를
+        # 정의한 믹스인 객체로, 중첩된 평범한 딕셔너리나 리스트는 바깥
+        # 믹스인의 것을 물려받음 (재귀 버전의 _traverse와 같음)
+        stack = [(
+            self.__dict__.items(), root, False, id(self),
+            self, self._cycle_keys,
+        )]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            frame = pop()
+            if frame.__class__ is int:
+                active.discard(frame)
+                continue
+            items, output, is_list, ident, owner, cycle_keys = frame
+            active.add(ident)
+            push(ident)  # 자식 프레임들을 모두 처리한 뒤에 꺼내짐
+            # 프레임마다 쌍을 한 번에 훑고 자식은 스택에 쌓기만 하므로
+            # 이터레이터를 멈췄다 다시 이어 가는 비용이 없음
+            for key, value in items:
+                kind = kind_get(type(value))
+                if kind is None:
+                    kind = self._kind_of(value)
+                if kind == LEAF:
+                    child = value
+                elif key in cycle_keys or id(value) in active:
+                    child = owner._on_cycle(key, value)
+                elif kind == LIST:
+                    child = []
+                    push((
+                        [(key, x) for x in value], child, True, id(value),
+                        owner, cycle_keys,
+                    ))
+                elif kind == DICT:
+                    child = {}
+                    push((
+                        value.items(), child, False, id(value),
+                        owner, cycle_keys,
+                    ))
+                elif kind == MIXIN:
+                    child = {}
+                    push((
+                        value.__dict__.items(), child, False, id(value),
+                        value, getattr(value, "_cycle_keys", frozenset()),
+                    ))
+                else:  # OBJECT
+                    child = {}
+                    push((
+                        value.__dict__.items(), child, False, id(value),
+                        owner, cycle_keys,
+                    ))
+
+                if is_list:
+                    output.append(child)
+                else:
+                    output[key] = child
+        return root
+
+
+print("Example 11")
+class IterativeBinaryTree(IterativeToDictMixin):
+    def __init__(self, value, left=None, right=None, parent=None):
+        self.value = value
+        self.left = left
+        self.right = right
+        self.parent = parent
+
+    _cycle_keys = frozenset({"parent"})
+
+    def _on_cycle(self, key, value):
+        if key == "parent":
+            return value.value  # BinaryTreeWithParent와 같은 결과
+        return super()._on_cycle(key, value)
+
+root = IterativeBinaryTree(10)
+root.left = IterativeBinaryTree(7, parent=root)
+root.left.right = IterativeBinaryTree(9, parent=root.left)
+orig_print = print
+print = pprint
+print(root.to_dict())
+print = orig_print
+
+expected = BinaryTreeWithParent(10)
+expected.left = BinaryTreeWithParent(7, parent=expected)
+expected.left.right = BinaryTreeWithParent(9, parent=expected.left)
+assert root.to_dict() == expected.to_dict()
+
+class IterativeNamedSubTree(IterativeToDictMixin):
+    def __init__(self, name, tree_with_parent):
+        self.name = name
+        self.tree_with_parent = tree_with_parent
+
+# 중첩된 트리의 parent도 그 트리 자신의 _on_cycle이 처리함 (Example 6과 같음)
+my_tree = IterativeNamedSubTree("foobar", root.left.right)
+expected_tree = NamedSubTree("foobar", expected.left.right)
+assert my_tree.to_dict() == expected_tree.to_dict()
+assert my_tree.to_dict()["tree_with_parent"]["parent"] == 7
+
+
+print("Example 12")
+class StreamingJsonMixin(JsonMixin):
+    def iter_json(self):
+        # 큰 문자열 하나를 만들지 않고 조각 단위로 인코딩함
+        return json.JSONEncoder().iterencode(self.to_dict())
+
+    def write_json(self, f):
+        for chunk in self.iter_json():
+            f.write(chunk)
+
+    def to_json(self):
+        return "".join(self.iter_json())
+
+class FastDatacenterRack(IterativeToDictMixin, StreamingJsonMixin):
+    def __init__(self, switch=None, machines=None):
+        self.switch = Switch(**switch)
+        self.machines = [
+            Machine(**kwargs) for kwargs in machines]
+
+deserialized = FastDatacenterRack.from_json(serialized)
+with open("rack.json", "w") as f:
+    deserialized.write_json(f)
+with open("rack.json") as f:
+    assert json.load(f) == json.loads(serialized)
+assert json.loads(deserialized.to_json()) == json.loads(serialized)
+
+
+print("Example 13")
+import sys
+import timeit
+
+def build_tree(tree_class, count):
+    # 재귀 없이 완전 이진 트리를 만듦
+    nodes = [tree_class(i) for i in range(count)]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < count:
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < count:
+            node.right = nodes[2 * i + 2]
+    return nodes[0]
+
+class IterativePlainTree(IterativeToDictMixin, BinaryTree):
+    pass  # BinaryTree와 속성이 같아야 공정하게 비교할 수 있음
+
+count = 2**15 - 1
+recursive_tree = build_tree(BinaryTree, count)
+iterative_tree = build_tree(IterativePlainTree, count)
+assert recursive_tree.to_dict() == iterative_tree.to_dict()
+# 기계 부하에 따른 편차를 줄이려고 여러 번 잰 최솟값을 씀
+def best_time(func):
+    return min(timeit.repeat(func, number=3, repeat=5)) / 3
+
+recursive_time = best_time(recursive_tree.to_dict)
+iterative_time = best_time(iterative_tree.to_dict)
+# 3.11 이후로 파이썬 함수 호출이 싸져서 반복 버전이 재귀 버전보다 빠르지
+# 않음 (여기서는 10~15% 느림). 이득은 속도가 아니라 재귀 한도 없이 깊은
+# 트리를 처리하고 순환을 자동으로 끊는 데 있음
+print(f"노드 {count}개 재귀: {recursive_time:.3f}초")
+print(f"노드 {count}개 반복: {iterative_time:.3f}초")
+
+deep = IterativeBinaryTree(0)
+node = deep
+for i in range(1, sys.getrecursionlimit() * 2):
+    node.left = IterativeBinaryTree(i, parent=node)
+    node = node.left
+
+output = deep.to_dict()  # 재귀 한도를 넘는 깊이에서도 동작함
+depth = 0
+while output is not None:
+    depth += 1
+    output = output["left"]
+print("깊은 트리의 깊이:", depth)
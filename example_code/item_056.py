@@ -390,3 +390,195 @@ assert easy_charges[point9] == 1.5
 print("Example 32")
 my_set = {point8, point9}
 assert my_set == {point8}
+
+
+print("Example 33")
+import heapq
+import math
+import operator
+from array import array
+from itertools import repeat
+
+@dataclass(frozen=True)
+class PointCollection:
+    # 점 하나마다 객체를 만드는 대신 좌표를 열 단위 배열로 저장함
+    names: tuple
+    xs: memoryview  # 읽기 전용 array("d") 뷰
+    ys: memoryview
+
+    @classmethod
+    def from_points(cls, points):
+        names = tuple(p.name for p in points)
+        xs = array("d", (p.x for p in points))
+        ys = array("d", (p.y for p in points))
+        return cls(
+            names,
+            memoryview(xs).toreadonly(),
+            memoryview(ys).toreadonly(),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def __hash__(self):
+        # memoryview("d")는 해시할 수 없으므로 값으로 해시함.
+        # 0.0 == -0.0처럼 값이 같으면 해시도 같아야 하므로 바이트를 쓰지 않음
+        return hash((self.names, tuple(self.xs), tuple(self.ys)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # 메모리 뷰를 잘라도 복사하지 않고 읽기 전용으로 남음
+            return PointCollection(
+                self.names[index], self.xs[index], self.ys[index]
+            )
+        return DataclassImmutablePoint(
+            self.names[index], self.xs[index], self.ys[index]
+        )
+
+    def distance_to(self, point):
+        # 루프를 map으로 C 수준에서 돌려 점마다 속성 조회를 하지 않음
+        dxs = map(operator.sub, self.xs, repeat(point.x))
+        dys = map(operator.sub, self.ys, repeat(point.y))
+        return array("d", map(math.hypot, dxs, dys))
+
+    def pairwise_distances(self, block_size=1024):
+        # 전체 n*n 행렬 대신 행과 열을 모두 나눈 타일 단위로 내놓아
+        # 한 번에 메모리에 있는 거리를 block_size**2개로 제한함
+        count = len(self)
+        for row_start in range(0, count, block_size):
+            row_end = min(row_start + block_size, count)
+            for col_start in range(0, count, block_size):
+                col_end = min(col_start + block_size, count)
+                xs = self.xs[col_start:col_end]
+                ys = self.ys[col_start:col_end]
+                block = []
+                for i in range(row_start, row_end):
+                    x, y = self.xs[i], self.ys[i]
+                    block.append(array("d", map(
+                        math.hypot,
+                        map(operator.sub, xs, repeat(x)),
+                        map(operator.sub, ys, repeat(y)),
+                    )))
+                yield row_start, col_start, block
+
+
+print("Example 34")
+class GridIndex:
+    def __init__(self, points, cell_size):
+        self.points = points
+        self.cell_size = cell_size
+        self.cells = {}
+        for i, (x, y) in enumerate(zip(points.xs, points.ys)):
+            key = (math.floor(x / cell_size), math.floor(y / cell_size))
+            self.cells.setdefault(key, []).append(i)
+        keys = list(self.cells)
+        xs = [key[0] for key in keys] or [0]
+        ys = [key[1] for key in keys] or [0]
+        self.bounds = (min(xs), max(xs), min(ys), max(ys))
+
+    def _ring(self, cx, cy, radius):
+        if radius == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-radius, radius + 1):
+            yield (cx + dx, cy - radius)
+            yield (cx + dx, cy + radius)
+        for dy in range(-radius + 1, radius):
+            yield (cx - radius, cy + dy)
+            yield (cx + radius, cy + dy)
+
+    def nearest(self, point, k=1):
+        size = self.cell_size
+        cx, cy = math.floor(point.x / size), math.floor(point.y / size)
+        min_x, max_x, min_y, max_y = self.bounds
+        limit = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy)
+        xs, ys = self.points.xs, self.points.ys
+        best = []  # (-거리, 인덱스) 최대 힙으로 상위 k개를 유지함
+        radius = 0
+        while radius <= limit:
+            for key in self._ring(cx, cy, radius):
+                for i in self.cells.get(key, ()):
+                    d = math.hypot(xs[i] - point.x, ys[i] - point.y)
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, i))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, i))
+            # 아직 보지 않은 칸은 radius * size보다 가까울 수 없음
+            if len(best) == k and -best[0][0] <= radius * size:
+                break
+            radius += 1
+        return [(i, -d) for d, i in sorted(best, reverse=True)]
+
+
+print("Example 35")
+points = PointCollection.from_points([
+    DataclassImmutablePoint("origin", 0, 0),
+    DataclassImmutablePoint("A", 3, 4),
+    DataclassImmutablePoint("B", -6, 8),
+    DataclassImmutablePoint("C", 1, 1),
+])
+print(list(points.distance_to(origin3)))
+for row_start, col_start, block in points.pairwise_distances(block_size=2):
+    print(row_start, col_start, [list(row) for row in block])
+    assert all(len(row) <= 2 for row in block) and len(block) <= 2
+index = GridIndex(points, cell_size=2.0)
+print(index.nearest(DataclassImmutablePoint("q", 2, 3), k=2))
+
+head = points[:2]
+assert isinstance(head, PointCollection) and len(head) == 2
+assert head == PointCollection.from_points([points[0], points[1]])
+assert hash(head) == hash(PointCollection.from_points([points[0], points[1]]))
+print({head: "앞의 두 점"}[head])
+
+try:
+    points.xs[0] = 100.0
+except TypeError:
+    pass  # 읽기 전용이므로 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+
+print("Example 36")
+import time
+
+rng = random.Random(56)
+instances = [
+    DataclassImmutablePoint(str(i), rng.uniform(0, 1000), rng.uniform(0, 1000))
+    for i in range(100_000)
+]
+collection = PointCollection.from_points(instances)
+queries = [
+    DataclassImmutablePoint("q", rng.uniform(0, 1000), rng.uniform(0, 1000))
+    for _ in range(20)
+]
+
+start = time.perf_counter()
+loop_results = [[distance(q, p) for p in instances] for q in queries]
+loop_time = time.perf_counter() - start
+
+start = time.perf_counter()
+batch_results = [collection.distance_to(q) for q in queries]
+batch_time = time.perf_counter() - start
+assert all(
+    math.isclose(a, b)
+    for loop, batch in zip(loop_results, batch_results)
+    for a, b in zip(loop, batch)
+)
+
+start = time.perf_counter()
+brute = [
+    heapq.nsmallest(5, range(len(instances)), key=row.__getitem__)
+    for row in loop_results
+]
+brute_time = loop_time + time.perf_counter() - start
+
+grid = GridIndex(collection, cell_size=10.0)
+start = time.perf_counter()
+nearest = [[i for i, _ in grid.nearest(q, k=5)] for q in queries]
+grid_time = time.perf_counter() - start
+assert nearest == brute
+
+print(f"distance 루프:      {loop_time:.3f}초")
+print(f"distance_to 일괄:   {batch_time:.3f}초")
+print(f"k-최근접 전수 조사: {brute_time:.3f}초")
+print(f"k-최근접 격자:      {grid_time:.4f}초")
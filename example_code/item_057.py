@@ -200,3 +200,362 @@ tree = BetterNode(
 
 print("7의 인덱스는", tree.index(7))
 print("10이 등장한 횟수는", tree.count(10))
+
+
+print("Example 15")
+class SizedNode(BinaryNode):
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1
+        self.size = 1  # 이 노드를 루트로 하는 서브트리의 노드 수
+
+def _height(node):
+    return node.height if node is not None else 0
+
+def _size(node):
+    return node.size if node is not None else 0
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+def _rotate_right(node):
+    left = node.left
+    node.left = left.right
+    left.right = node
+    _update(node)
+    _update(left)
+    return left
+
+def _rotate_left(node):
+    right = node.right
+    node.right = right.left
+    right.left = node
+    _update(node)
+    _update(right)
+    return right
+
+def _rebalance(node):
+    # AVL 규칙: 양쪽 서브트리의 높이 차이가 1을 넘지 않게 회전함
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+def _insert(node, value):
+    if node is None:
+        return SizedNode(value)
+    if value < node.value:
+        node.left = _insert(node.left, value)
+    else:
+        node.right = _insert(node.right, value)
+    return _rebalance(node)
+
+def _remove_min(node):
+    if node.left is None:
+        return node.right
+    node.left = _remove_min(node.left)
+    return _rebalance(node)
+
+def _remove(node, value):
+    if node is None:
+        raise ValueError(f"{value!r} is not in tree")
+    if value < node.value:
+        node.left = _remove(node.left, value)
+    elif node.value < value:
+        node.right = _remove(node.right, value)
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor = node.right
+        while successor.left is not None:
+            successor = successor.left
+        node.value = successor.value
+        node.right = _remove_min(node.right)
+    return _rebalance(node)
+
+
+print("Example 16")
+class OrderStatisticTree(Sequence):
+    def __init__(self, values=()):
+        self.root = None
+        for value in values:
+            self.insert(value)
+
+    def insert(self, value):
+        self.root = _insert(self.root, value)
+
+    def remove(self, value):
+        self.root = _remove(self.root, value)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __getitem__(self, index):
+        # 서브트리 크기를 보고 한쪽으로만 내려가므로 O(log n)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Index {index} is out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.value
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def rank(self, value):
+        # value보다 작은 원소의 개수
+        result = 0
+        node = self.root
+        while node is not None:
+            if value <= node.value:
+                node = node.left
+            else:
+                result += _size(node.left) + 1
+                node = node.right
+        return result
+
+    def _rank_right(self, value):
+        # value 이하인 원소의 개수
+        result = 0
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            else:
+                result += _size(node.left) + 1
+                node = node.right
+        return result
+
+    def index(self, value, start=0, stop=None):
+        i = max(self.rank(value), start)
+        if i < len(self) and (stop is None or i < stop):
+            if self[i] == value:
+                return i
+        raise ValueError(f"{value!r} is not in tree")
+
+    def count(self, value):
+        return self._rank_right(value) - self.rank(value)
+
+    def __contains__(self, value):
+        return self.count(value) > 0
+
+    def __iter__(self):
+        # 제너레이터를 단계마다 만들지 않고 명시적인 스택으로 중위 순회함
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+
+print("Example 17")
+tree = OrderStatisticTree([10, 5, 15, 2, 6, 7, 11])
+print("트리: ", list(tree))
+print("인덱스 0:", tree[0], "인덱스 -1:", tree[-1])
+print("7의 인덱스는", tree.index(7))
+print("10이 등장한 횟수는", tree.count(10))
+tree.insert(6)
+tree.remove(10)
+print("삽입/삭제 후:", list(tree), "길이:", len(tree))
+assert list(tree) == [2, 5, 6, 6, 7, 11, 15]
+assert [tree[i] for i in range(len(tree))] == list(tree)
+
+
+print("Example 18")
+import time
+
+def build_better_node(values):
+    if not values:
+        return None
+    middle = len(values) // 2
+    return BetterNode(
+        values[middle],
+        left=build_better_node(values[:middle]),
+        right=build_better_node(values[middle + 1 :]),
+    )
+
+def scan_by_index(tree):
+    start = time.perf_counter()
+    total = 0
+    for i in range(len(tree)):
+        total += tree[i]
+    return time.perf_counter() - start
+
+count = 1000
+values = list(range(count))
+random.shuffle(values)
+old_tree = build_better_node(sorted(values))
+new_tree = OrderStatisticTree(values)
+print(f"{count}개 인덱스 순회: BetterNode {scan_by_index(old_tree):.3f}초, "
+      f"OrderStatisticTree {scan_by_index(new_tree):.4f}초")
+
+count = 100_000
+values = list(range(count))
+random.shuffle(values)
+start = time.perf_counter()
+big_tree = OrderStatisticTree(values)
+build_time = time.perf_counter() - start
+print(f"{count}개 삽입: {build_time:.3f}초, "
+      f"인덱스 순회: {scan_by_index(big_tree):.3f}초")
+
+
+print("Example 19")
+from collections import Counter
+
+_MISSING = object()
+
+class CountingFrequencyList(list):
+    def __init__(self, members=()):
+        super().__init__()
+        self.counts = {}   # 원소 -> 등장 횟수
+        self.buckets = {}  # 등장 횟수 -> 그만큼 등장한 원소 집합
+        self.extend(members)
+
+    def _change(self, item, delta):
+        old = self.counts.get(item, 0)
+        new = old + delta
+        if old:
+            bucket = self.buckets[old]
+            bucket.discard(item)
+            if not bucket:
+                del self.buckets[old]
+        if new:
+            self.counts[item] = new
+            self.buckets.setdefault(new, set()).add(item)
+        else:
+            del self.counts[item]
+
+    def frequency(self, item=_MISSING):
+        if item is _MISSING:
+            return dict(self.counts)
+        return self.counts.get(item, 0)
+
+    def most_common(self, k):
+        # 서로 다른 등장 횟수의 종류만큼만 정렬하면 됨
+        result = []
+        for count in sorted(self.buckets, reverse=True):
+            for item in self.buckets[count]:
+                if len(result) == k:
+                    return result
+                result.append((item, count))
+        return result
+
+    def append(self, item):
+        super().append(item)
+        self._change(item, 1)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._change(item, 1)
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        for item, count in Counter(items).items():  # C로 구현된 개수 세기
+            self._change(item, count)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, n):
+        if n <= 0:
+            self.clear()
+            return self
+        counts = list(self.counts.items())
+        super().__imul__(n)
+        for item, count in counts:
+            self._change(item, count * (n - 1))
+        return self
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._change(item, -1)
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._change(item, -1)
+
+    def clear(self):
+        super().clear()
+        self.counts.clear()
+        self.buckets.clear()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed = self[index]
+            super().__setitem__(index, value)
+            for item, count in Counter(removed).items():
+                self._change(item, -count)
+            for item, count in Counter(value).items():
+                self._change(item, count)
+        else:
+            old = self[index]
+            super().__setitem__(index, value)
+            self._change(old, -1)
+            self._change(value, 1)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for item, count in Counter(removed).items():
+            self._change(item, -count)
+
+
+print("Example 20")
+foo = CountingFrequencyList(["a", "b", "a", "c", "b", "a", "d"])
+foo.pop()  # 맨 끝의 "d" 삭제
+print("pop한 다음:", repr(foo))
+print("빈도:      ", foo.frequency())
+print("a의 빈도:  ", foo.frequency("a"))
+foo[0:2] = ["c", "c", "c"]
+del foo[-1]
+foo += ["b"]
+print("수정한 다음:", repr(foo), foo.most_common(2))
+assert foo.frequency() == Counter(foo)
+
+
+print("Example 21")
+def interleaved(factory, rounds=2_000):
+    items = factory([i % 100 for i in range(5_000)])
+    start = time.perf_counter()
+    for i in range(rounds):
+        items.append(i % 37)
+        items.pop(0)
+        items.frequency()[i % 37]
+    return time.perf_counter() - start
+
+def interleaved_item(rounds=2_000):
+    items = CountingFrequencyList([i % 100 for i in range(5_000)])
+    start = time.perf_counter()
+    for i in range(rounds):
+        items.append(i % 37)
+        items.pop(0)
+        items.frequency(i % 37)
+    return time.perf_counter() - start
+
+print(f"FrequencyList:                 {interleaved(FrequencyList):.4f}초")
+print(f"CountingFrequencyList:         "
+      f"{interleaved(CountingFrequencyList):.4f}초")
+print(f"CountingFrequencyList(item):   {interleaved_item():.4f}초")
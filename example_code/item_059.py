@@ -208,3 +208,193 @@ assert not deduct(bucket, 79)
 
 fill(bucket, 1)
 assert bucket.quota == 1
+
+
+print("Example 12")
+import asyncio
+import threading
+import time
+from array import array
+
+NS_PER_SECOND = 1_000_000_000
+
+class TokenBucketLimiter:
+    def __init__(self, rate, capacity, idle_ttl=60.0, lock_stripes=64):
+        # 토큰은 (토큰 수 * 10**9) 단위의 정수로 저장하고, rate도 초당
+        # 같은 단위의 정수로 바꿔 두므로 0.5 같은 소수 비율도 정수 연산만 씀
+        if rate <= 0:
+            raise ValueError("rate는 양수여야 함")
+        self.rate = round(rate * NS_PER_SECOND)
+        self.capacity = int(capacity * NS_PER_SECOND)
+        self.idle_ttl_ns = int(idle_ttl * NS_PER_SECOND)
+        self.slots = {}           # 키 -> 배열 인덱스
+        self.keys = []            # 배열 인덱스 -> 키
+        self.tokens = array("q")  # 키마다 남은 토큰
+        self.updated = array("q") # 키마다 마지막으로 갱신한 시각(ns)
+        self.free = []
+        self.alloc_lock = threading.Lock()
+        self.locks = [threading.Lock() for _ in range(lock_stripes)]
+
+    def _slot(self, key, now):
+        slot = self.slots.get(key)
+        if slot is not None:
+            return slot
+        with self.alloc_lock:
+            slot = self.slots.get(key)
+            if slot is not None:
+                return slot
+            if self.free:
+                slot = self.free.pop()
+                self.keys[slot] = key
+                self.tokens[slot] = self.capacity
+                self.updated[slot] = now
+            else:
+                slot = len(self.keys)
+                self.keys.append(key)
+                self.tokens.append(self.capacity)
+                self.updated.append(now)
+            self.slots[key] = slot
+            return slot
+
+    def _take(self, slot, cost, now):
+        tokens = self.tokens[slot]
+        tokens += (now - self.updated[slot]) * self.rate // NS_PER_SECOND
+        if tokens > self.capacity:
+            tokens = self.capacity
+        self.updated[slot] = now
+        if tokens >= cost:
+            self.tokens[slot] = tokens - cost
+            return True
+        self.tokens[slot] = tokens
+        return False
+
+    def try_acquire(self, key, n=1):
+        now = time.monotonic_ns()
+        cost = int(n * NS_PER_SECOND)
+        while True:
+            slot = self._slot(key, now)
+            with self.locks[slot % len(self.locks)]:
+                # 락을 잡기 전에 expire_idle이 슬롯을 다른 키에 넘겼을 수 있음
+                if self.keys[slot] == key:
+                    return self._take(slot, cost, now)
+
+    def try_acquire_many(self, keys, n=1):
+        # 시각을 한 번만 읽고, 조회할 속성을 지역 변수로 묶어 루프를 돎
+        now = time.monotonic_ns()
+        slots = self.slots
+        slot_keys = self.keys
+        tokens = self.tokens
+        updated = self.updated
+        locks = self.locks
+        stripes = len(locks)
+        rate = self.rate
+        capacity = self.capacity
+        cost = int(n * NS_PER_SECOND)
+        results = []
+        for key in keys:
+            while True:
+                slot = slots.get(key)
+                if slot is None:
+                    slot = self._slot(key, now)
+                with locks[slot % stripes]:
+                    if slot_keys[slot] != key:
+                        continue  # 회수된 슬롯이므로 다시 할당받음
+                    elapsed = now - updated[slot]
+                    available = tokens[slot] + elapsed * rate // NS_PER_SECOND
+                    if available > capacity:
+                        available = capacity
+                    updated[slot] = now
+                    allowed = available >= cost
+                    tokens[slot] = available - cost if allowed else available
+                break
+            results.append(allowed)
+        return results
+
+    async def acquire(self, key, n=1):
+        # 이벤트 루프를 막지 않고 토큰이 찰 때까지 기다림
+        cost = int(n * NS_PER_SECOND)
+        if cost > self.capacity:
+            raise ValueError(f"{n}개는 버킷 용량을 넘으므로 영원히 얻을 수 없음")
+        while not self.try_acquire(key, n):
+            slot = self._slot(key, time.monotonic_ns())
+            deficit = cost - self.tokens[slot]
+            await asyncio.sleep(max(deficit, 1) / self.rate)
+
+    def expire_idle(self):
+        now = time.monotonic_ns()
+        cutoff = now - self.idle_ttl_ns
+        with self.alloc_lock:
+            for key, slot in list(self.slots.items()):
+                # 슬롯 락을 잡고 회수해야 사용 중인 슬롯을 빼앗지 않음
+                with self.locks[slot % len(self.locks)]:
+                    if self.updated[slot] < cutoff:
+                        del self.slots[key]
+                        self.keys[slot] = None
+                        self.free.append(slot)
+
+    def __len__(self):
+        return len(self.slots)
+
+
+print("Example 13")
+limiter = TokenBucketLimiter(rate=10, capacity=5, idle_ttl=0.05)
+print([limiter.try_acquire("api-key-1") for _ in range(7)])
+print(limiter.try_acquire_many(["api-key-2", "api-key-2", "api-key-1"], 3))
+time.sleep(0.1)
+print("0.1초 뒤:", limiter.try_acquire("api-key-1"))  # 토큰 1개가 다시 참
+limiter.expire_idle()
+print("유휴 키를 정리한 뒤 키 개수:", len(limiter))
+
+async def consume():
+    start = time.perf_counter()
+    for _ in range(3):
+        await limiter.acquire("api-key-3", 5)
+    return time.perf_counter() - start
+
+print(f"비동기로 15 토큰 획득: {asyncio.run(consume()):.2f}초")
+
+slow = TokenBucketLimiter(rate=0.5, capacity=2.5)  # 소수 비율과 용량
+print([slow.try_acquire("api-key-4") for _ in range(3)])
+
+try:
+    asyncio.run(slow.acquire("api-key-4", 3))
+except ValueError as e:
+    print(e)  # 용량보다 많이 요청하면 무한히 기다리지 않고 바로 실패함
+else:
+    assert False
+
+
+print("Example 14")
+import random
+
+key_count = 100_000
+requests = [f"key-{random.randrange(key_count)}" for _ in range(200_000)]
+
+def bucket_decisions():
+    buckets = {}
+    start = time.perf_counter()
+    for key in requests:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = NewBucket(60)
+            fill(bucket, 100)
+        deduct(bucket, 1)
+    return len(requests) / (time.perf_counter() - start)
+
+def limiter_decisions():
+    limiter = TokenBucketLimiter(rate=100, capacity=100)
+    start = time.perf_counter()
+    for key in requests:
+        limiter.try_acquire(key)
+    return len(requests) / (time.perf_counter() - start)
+
+def limiter_batch_decisions():
+    limiter = TokenBucketLimiter(rate=100, capacity=100)
+    start = time.perf_counter()
+    for i in range(0, len(requests), 1000):
+        limiter.try_acquire_many(requests[i : i + 1000])
+    return len(requests) / (time.perf_counter() - start)
+
+print(f"NewBucket:             {bucket_decisions():12,.0f} 결정/초")
+print(f"TokenBucketLimiter:    {limiter_decisions():12,.0f} 결정/초")
+print(f"일괄 결정:             {limiter_batch_decisions():12,.0f} 결정/초")
@@ -231,3 +231,139 @@ first_exam.math_grade = 78
 first_exam.writing_grade = 89
 first_exam.science_grade = 94
 print(first_exam.__dict__)
+
+
+print("Example 17")
+class SlotGrade:
+    def __set_name__(self, owner, name):
+        self.internal_name = "_" + name
+        # __slots__가 만든 멤버 디스크립터를 직접 써서 문자열 조회를 피함
+        self.slot = owner.__dict__[self.internal_name]
+
+    def __get__(self, instance, instance_type):
+        if instance is None:
+            return self
+        return self.slot.__get__(instance, instance_type)
+
+    def __set__(self, instance, value):
+        if not (0 <= value <= 100):
+            raise ValueError("점수는 0 이상 100 이하여야 함")
+        self.slot.__set__(instance, value)
+
+
+print("Example 18")
+import operator
+
+class SlotExam:
+    __slots__ = ("_math_grade", "_writing_grade", "_science_grade")
+
+    math_grade = SlotGrade()
+    writing_grade = SlotGrade()
+    science_grade = SlotGrade()
+
+    @classmethod
+    def grade_fields(cls):
+        return [
+            name
+            for name, value in vars(cls).items()
+            if isinstance(value, SlotGrade)
+        ]
+
+    @classmethod
+    def from_rows(cls, rows):
+        # 열 단위로 한꺼번에 검증한 다음 검증 없이 슬롯을 채움
+        fields = cls.grade_fields()
+        rows = list(rows)  # 제너레이터 같은 이터러블도 한 번만 소비함
+        width = len(fields)
+        if any(length != width for length in set(map(len, rows))):
+            # zip(*rows)은 길이가 다른 행을 조용히 잘라내므로 미리 검사함
+            index, row = next(
+                (i, row) for i, row in enumerate(rows) if len(row) != width
+            )
+            raise ValueError(
+                f"{index}번 행의 열 수는 {width}여야 함: {row!r}"
+            )
+        columns = list(zip(*rows)) if rows else [()] * width
+        for name, column in zip(fields, columns):
+            # min/max는 NaN이 어디 있느냐에 따라 놓치므로 NaN(자기 자신과
+            # 다른 값)을 C 수준의 map으로 따로 검사함
+            if column and (
+                not (0 <= min(column) and max(column) <= 100)
+                or any(map(operator.ne, column, column))
+            ):
+                bad = next(v for v in column if not (0 <= v <= 100))
+                raise ValueError(
+                    f"{name} 점수는 0 이상 100 이하여야 함: {bad!r}"
+                )
+        instances = [object.__new__(cls) for _ in range(len(rows))]
+        for name, column in zip(fields, columns):
+            setter = vars(cls)[name].slot.__set__
+            for _ in map(setter, instances, column):
+                pass
+        return instances
+
+exams = SlotExam.from_rows([(78, 89, 94), (100, 0, 55)])
+print(exams[0].math_grade, exams[1].writing_grade)
+exams[1].science_grade = 60
+assert exams[1].science_grade == 60
+
+try:
+    SlotExam.from_rows([(78, 89, 94), (101, 0, 55)])
+except ValueError:
+    pass  # 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+try:
+    SlotExam.from_rows([(1, 2, 3), (4, 5)])
+except ValueError:
+    pass  # 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+try:
+    SlotExam.from_rows([(50, 50, 50), (float("nan"), 1, 2)])
+except ValueError:
+    pass  # SlotGrade.__set__처럼 NaN을 거부하리라 예상함
+else:
+    assert False
+
+exams = SlotExam.from_rows(iter([(78, 89, 94)]))
+assert exams[0].science_grade == 94
+
+
+print("Example 19")
+import time
+import tracemalloc
+
+rows = [
+    (random.randint(0, 100), random.randint(0, 100), random.randint(0, 100))
+    for _ in range(100_000)
+]
+
+def load_named(rows):
+    exams = []
+    for math, writing, science in rows:
+        exam = NamedExam()
+        exam.math_grade = math
+        exam.writing_grade = writing
+        exam.science_grade = science
+        exams.append(exam)
+    return exams
+
+def measure(loader):
+    start = time.perf_counter()
+    exams = loader(rows)
+    elapsed = time.perf_counter() - start
+    del exams
+    tracemalloc.start()  # 추적하면 느려지므로 메모리는 따로 잼
+    exams = loader(rows)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return exams, elapsed, size
+
+named, named_time, named_size = measure(load_named)
+slotted, slot_time, slot_size = measure(SlotExam.from_rows)
+assert [e.science_grade for e in named] == [e.science_grade for e in slotted]
+print(f"NamedGrade: {named_time:.3f}초, {named_size / 2**20:.1f} MiB")
+print(f"SlotGrade:  {slot_time:.3f}초, {slot_size / 2**20:.1f} MiB")
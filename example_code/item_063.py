@@ -215,3 +215,221 @@ data = before.serialize()
 print("직렬화:  ", data)
 print("역직렬화:", deserialize(data))
 
+
+
+print("Example 15")
+import struct
+
+BINARY_REGISTRY = {}  # 타입 ID -> (클래스, 미리 컴파일한 Struct)
+TYPE_IDS = {}         # 클래스 -> 타입 ID
+HEADER = struct.Struct("<H")
+
+class BinarySerializable(BetterRegisteredSerializable):
+    def __init_subclass__(cls, fmt=None, type_id=None):
+        if fmt is None:
+            super().__init_subclass__()
+            return
+        # 정의 순서로 ID를 정하면 클래스를 다른 순서로 임포트하는 상대방이
+        # 다른 타입으로 해석하므로, 고정된 ID를 명시적으로 받음
+        if type_id is None:
+            raise TypeError(f"{cls.__name__}에 type_id를 지정해야 함")
+        if not 0 <= type_id < 2 ** (8 * HEADER.size):
+            raise ValueError(f"type_id 범위를 벗어남: {type_id}")
+        if type_id in BINARY_REGISTRY:
+            existing = BINARY_REGISTRY[type_id][0].__name__
+            raise ValueError(f"type_id {type_id}는 이미 {existing}가 사용함")
+        super().__init_subclass__()  # JSON 레지스트리에도 등록함
+        BINARY_REGISTRY[type_id] = (cls, struct.Struct("<" + fmt))
+        TYPE_IDS[cls] = type_id
+
+    def serialize_binary(self):
+        type_id = TYPE_IDS[self.__class__]
+        packer = BINARY_REGISTRY[type_id][1]
+        return HEADER.pack(type_id) + packer.pack(*self.args)
+
+def deserialize_binary(data, offset=0):
+    (type_id,) = HEADER.unpack_from(data, offset)
+    target_class, packer = BINARY_REGISTRY[type_id]
+    offset += HEADER.size
+    args = packer.unpack_from(data, offset)
+    return target_class(*args), offset + packer.size
+
+
+print("Example 16")
+class BinaryPoint2D(BinarySerializable, fmt="dd", type_id=1):
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.x = x
+        self.y = y
+
+class BinaryVector3D(BinarySerializable, fmt="ddd", type_id=2):
+    def __init__(self, x, y, z):
+        super().__init__(x, y, z)
+        self.x, self.y, self.z = x, y, z
+
+before = BinaryPoint2D(5.0, 3.0)
+print("객체:    ", before)
+data = before.serialize_binary()
+print("직렬화:  ", data)
+after, _ = deserialize_binary(data)
+print("역직렬화:", after)
+
+# 같은 클래스를 기존 JSON 형식으로도 주고받을 수 있음
+assert deserialize(before.serialize()).args == after.args
+
+try:
+    class BinaryPoint3D(BinarySerializable, fmt="ddd", type_id=1):
+        pass
+except ValueError:
+    pass  # 이미 사용 중인 ID이므로 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+
+print("Example 17")
+def serialize_many(objects):
+    parts = []
+    for obj in objects:
+        type_id = TYPE_IDS[obj.__class__]
+        packer = BINARY_REGISTRY[type_id][1]
+        parts.append(HEADER.pack(type_id))
+        parts.append(packer.pack(*obj.args))
+    return b"".join(parts)
+
+def deserialize_many(data):
+    offset = 0
+    end = len(data)
+    while offset < end:
+        obj, offset = deserialize_binary(data, offset)
+        yield obj
+
+def deserialize_any(data):
+    # JSON 텍스트와 이진 레코드를 모두 받아들임
+    if isinstance(data, str):
+        return deserialize(data)
+    obj, _ = deserialize_binary(data)
+    return obj
+
+stream = serialize_many(
+    [BinaryPoint2D(1.5, 2.5), BinaryVector3D(1.0, -2.0, 3.0)]
+)
+print(list(deserialize_many(stream)))
+print(deserialize_any(BinaryVector3D(4.0, 5.0, 6.0).serialize()))
+print(deserialize_any(BinaryVector3D(4.0, 5.0, 6.0).serialize_binary()))
+
+
+print("Example 18")
+import timeit
+
+objects = [
+    BinaryPoint2D(float(i), float(-i)) if i % 2 else
+    BinaryVector3D(float(i), 0.5, -1.5)
+    for i in range(10_000)
+]
+
+def json_roundtrip():
+    return [deserialize(obj.serialize()) for obj in objects]
+
+def binary_roundtrip():
+    return list(deserialize_many(serialize_many(objects)))
+
+json_size = sum(len(obj.serialize().encode()) for obj in objects)
+binary_size = len(serialize_many(objects))
+json_time = timeit.timeit(json_roundtrip, number=3) / 3
+binary_time = timeit.timeit(binary_roundtrip, number=3) / 3
+
+assert [x.args for x in json_roundtrip()] == [
+    x.args for x in binary_roundtrip()
+]
+print(f"JSON:  {json_size:>7} 바이트, "
+      f"{len(objects) / json_time:,.0f} 객체/초")
+print(f"이진:  {binary_size:>7} 바이트, "
+      f"{len(objects) / binary_time:,.0f} 객체/초")
+
+
+print("Example 19")
+def iter_lines(path, block_size=1 << 20):
+    # 큰 블록 단위로 읽고, 블록 경계에 걸친 줄은 다음 블록과 이어 붙임
+    with open(path, "rb") as f:
+        leftover = b""
+        while block := f.read(block_size):
+            lines = (leftover + block).split(b"\n")
+            leftover = lines.pop()
+            yield from lines
+        if leftover:
+            yield leftover
+
+class DispatchTable(dict):
+    # 클래스 이름을 한 번만 REGISTRY에서 찾고 그 뒤로는 캐시를 씀
+    def __missing__(self, name):
+        target_class = REGISTRY[name]
+        self[name] = target_class
+        return target_class
+
+def iter_deserialize(path, block_size=1 << 20):
+    dispatch = DispatchTable()
+    loads = json.loads
+    for line in iter_lines(path, block_size):
+        if not line.strip():
+            continue
+        params = loads(line)
+        yield dispatch[params["class"]](*params["args"])
+
+
+print("Example 20")
+with open("objects.ndjson", "w") as f:
+    for i in range(1000):
+        f.write(EvenBetterPoint2D(i, -i).serialize() + "\n")
+        f.write(Vector3D(i, 0, 1).serialize() + "\n")
+
+it = iter_deserialize("objects.ndjson", block_size=64)
+print(next(it), next(it), next(it))
+assert sum(1 for _ in iter_deserialize("objects.ndjson")) == 2000
+
+
+print("Example 21")
+import itertools
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+def decode_lines(lines):
+    # 자식 프로세스는 JSON만 해석하고, 객체는 부모 프로세스가 만듦
+    result = []
+    for line in lines:
+        if line.strip():
+            params = json.loads(line)
+            result.append((params["class"], params["args"]))
+    return result
+
+def iter_deserialize_parallel(
+    path, executor, chunk_lines=10_000, max_pending=4
+):
+    dispatch = DispatchTable()
+    lines = iter_lines(path)
+    pending = deque()
+    while True:
+        # 진행 중인 청크 수를 제한해서 메모리 사용량을 일정하게 유지함
+        while len(pending) < max_pending:
+            chunk = list(itertools.islice(lines, chunk_lines))
+            if not chunk:
+                break
+            pending.append(executor.submit(decode_lines, chunk))
+        if not pending:
+            return
+        for name, args in pending.popleft().result():
+            yield dispatch[name](*args)
+
+
+print("Example 22")
+if "fork" in multiprocessing.get_all_start_methods():
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        parallel = list(
+            iter_deserialize_parallel(
+                "objects.ndjson", pool, chunk_lines=300
+            )
+        )
+    serial = list(iter_deserialize("objects.ndjson"))
+    assert [x.args for x in parallel] == [x.args for x in serial]
+    print(len(parallel), "개 객체를 병렬로 역직렬화함")
@@ -271,3 +271,321 @@ except KeyError:
     pass  # 이 문장이 실행되리라 예상함
 else:
     assert False
+
+
+print("Example 12")
+import itertools
+import struct
+import sys
+import threading
+import time
+
+RECORD = struct.Struct("<qHI")  # 타임스탬프(ns), 함수 ID, 본문 길이
+
+class RingBuffer:
+    # 쓰는 스레드와 읽는 스레드가 하나씩이므로 락이 필요 없음
+    __slots__ = ("records", "capacity", "head", "tail", "dropped")
+
+    def __init__(self, capacity):
+        self.records = [None] * capacity
+        self.capacity = capacity
+        self.head = 0  # 소유 스레드만 증가시킴
+        self.tail = 0  # 플러셔만 증가시킴
+        self.dropped = 0
+
+    def push(self, record):
+        self.records[self.head % self.capacity] = record
+        self.head += 1
+
+    def drain(self):
+        head = self.head
+        if head - self.tail > self.capacity:
+            # 가득 차서 덮어써진 레코드는 버림
+            self.dropped += head - self.tail - self.capacity
+            self.tail = head - self.capacity
+        for i in range(self.tail, head):
+            yield self.records[i % self.capacity]
+        self.tail = head
+
+
+print("Example 13")
+# 플러시할 때 repr해도 호출 시점과 결과가 같은 불변 타입
+IMMUTABLE_TYPES = frozenset(
+    {int, float, complex, bool, str, bytes, type(None), range}
+)
+
+class Rendered(str):
+    # 미리 repr한 문자열. 플러시할 때 따옴표 없이 그대로 출력됨
+    def __repr__(self):
+        return str(self)
+
+def freeze(value):
+    # 가변 객체는 기록하는 순간 repr해서 호출 시점의 상태를 남기고,
+    # 버퍼가 임의의 객체를 붙잡아 두지 않게 함. 불변 값은 지연 포맷팅함
+    kind = type(value)
+    if kind in IMMUTABLE_TYPES:
+        return value
+    if kind is tuple and all(type(x) in IMMUTABLE_TYPES for x in value):
+        return value
+    return Rendered(repr(value))
+
+class SamplingTracer:
+    def __init__(
+        self,
+        path,
+        every=None,      # N번 호출마다 1번 기록
+        interval=None,   # 또는 interval 초마다 1번 기록
+        capacity=4096,
+        flush_interval=0.1,
+    ):
+        self.path = path
+        self.every = every
+        self.interval_ns = None if interval is None else int(interval * 1e9)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.functions = []
+        self.counter = itertools.count()
+        self.next_time = 0
+        self.local = threading.local()
+        self.buffers = []
+        self.buffers_lock = threading.Lock()  # 버퍼 등록에만 씀
+        self.stop_event = threading.Event()
+        self.flusher = None
+
+    def register(self, name):
+        self.functions.append(name)
+        return len(self.functions) - 1
+
+    def should_sample(self):
+        if self.every is not None:
+            return self.every > 0 and next(self.counter) % self.every == 0
+        if self.interval_ns is not None:
+            now = time.monotonic_ns()
+            if now >= self.next_time:
+                self.next_time = now + self.interval_ns
+                return True
+        return False
+
+    def buffer(self):
+        try:
+            return self.local.buffer
+        except AttributeError:
+            buffer = RingBuffer(self.capacity)
+            with self.buffers_lock:
+                self.buffers.append(buffer)
+            self.local.buffer = buffer
+            return buffer
+
+    def record(self, func_id, args, kwargs, result):
+        # 샘플로 뽑힌 호출만 여기까지 오므로 가변 값의 repr 비용은 제한됨
+        self.buffer().push(
+            (time.time_ns(), func_id, args, freeze(kwargs), freeze(result))
+        )
+
+    def trace_func(self, func):
+        if hasattr(func, "tracing"):
+            return func
+
+        func_id = self.register(func.__name__)
+        should_sample = self.should_sample
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not should_sample():
+                return func(*args, **kwargs)
+            frozen_args = freeze(args)  # trace_func처럼 호출 전의 인자를 남김
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as e:
+                result = e
+                raise
+            finally:
+                self.record(func_id, frozen_args, kwargs, result)
+
+        wrapper.tracing = True
+        return wrapper
+
+
+print("Example 14")
+def write_records(tracer, f):
+    with tracer.buffers_lock:
+        buffers = list(tracer.buffers)
+    for buffer in buffers:
+        for ts, func_id, args, kwargs, result in buffer.drain():
+            body = f"{args!r}, {kwargs!r} -> {result!r}".encode()
+            f.write(RECORD.pack(ts, func_id, len(body)))
+            f.write(body)
+
+def flush_loop(tracer, f):
+    while not tracer.stop_event.wait(tracer.flush_interval):
+        write_records(tracer, f)
+    write_records(tracer, f)
+    f.close()
+
+def start_tracer(tracer):
+    f = open(tracer.path, "wb")
+    tracer.flusher = threading.Thread(
+        target=flush_loop, args=(tracer, f), daemon=True
+    )
+    tracer.flusher.start()
+
+def stop_tracer(tracer):
+    tracer.stop_event.set()
+    tracer.flusher.join()
+
+def read_trace(path, functions):
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset < len(data):
+        ts, func_id, size = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        body = data[offset : offset + size].decode()
+        offset += size
+        yield ts, functions[func_id], body
+
+
+print("Example 15")
+class SamplingTraceMeta(type):
+    def __new__(meta, name, bases, class_dict, tracer=None):
+        klass = super().__new__(meta, name, bases, class_dict)
+        if tracer is None:
+            # 하위 클래스는 tracer를 다시 지정하지 않아도 부모의 것을 물려받음
+            tracer = getattr(klass, "sampling_tracer", None)
+            if tracer is None:
+                return klass
+        klass.sampling_tracer = tracer
+
+        for key in dir(klass):
+            if key in IGNORE_METHODS:
+                continue
+
+            value = getattr(klass, key)
+            if not isinstance(value, TRACE_TYPES):
+                continue
+
+            wrapped = tracer.trace_func(value)
+            setattr(klass, key, wrapped)
+
+        return klass
+
+tracer = SamplingTracer("trace.bin", every=2)
+start_tracer(tracer)
+
+class SampledTraceDict(dict, metaclass=SamplingTraceMeta, tracer=tracer):
+    pass
+
+trace_dict = SampledTraceDict([("hi", 1)])
+trace_dict["there"] = 2
+trace_dict["hi"]
+try:
+    trace_dict["존재하지 않음"]
+except KeyError:
+    pass  # 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+class SampledSubDict(SampledTraceDict):
+    def first_key(self):
+        return next(iter(self))
+
+sub_dict = SampledSubDict([("hi", 1)])
+sub_dict.first_key()
+sub_dict.first_key()
+assert SampledSubDict.sampling_tracer is tracer
+
+stop_tracer(tracer)
+records = list(read_trace(tracer.path, tracer.functions))
+for ts, name, body in records:
+    print(f"{name}({body})")
+# 가변 값은 기록할 때 repr하므로 플러시 시점이 아닌 호출 시점의 상태가 남음
+assert records[0][2].endswith("-> {}")
+
+
+print("Example 16")
+def install_monitoring(tracer, klass):
+    # 파이썬으로 작성한 메서드는 래퍼 없이 sys.monitoring으로 추적함
+    # (C로 구현한 메서드에는 PY_RETURN 이벤트가 없으므로 래퍼를 써야 함)
+    monitoring = sys.monitoring
+    tool_id = monitoring.PROFILER_ID
+    monitoring.use_tool_id(tool_id, "sampling_tracer")
+    code_ids = {}
+
+    for key, value in vars(klass).items():
+        if isinstance(value, types.FunctionType):
+            code_ids[value.__code__] = tracer.register(key)
+            monitoring.set_local_events(
+                tool_id, value.__code__, monitoring.events.PY_RETURN
+            )
+
+    def on_return(code, instruction_offset, retval):
+        func_id = code_ids.get(code)
+        if func_id is None or not tracer.should_sample():
+            return
+        frame = sys._getframe(1)
+        tracer.record(func_id, dict(frame.f_locals), {}, retval)
+
+    monitoring.register_callback(
+        tool_id, monitoring.events.PY_RETURN, on_return
+    )
+
+def uninstall_monitoring():
+    monitoring = sys.monitoring
+    monitoring.register_callback(
+        monitoring.PROFILER_ID, monitoring.events.PY_RETURN, None
+    )
+    monitoring.free_tool_id(monitoring.PROFILER_ID)
+
+class Inventory:
+    def __init__(self):
+        self.items = {}
+
+    def add(self, name, count):
+        self.items[name] = self.items.get(name, 0) + count
+        return self.items[name]
+
+if hasattr(sys, "monitoring"):
+    tracer = SamplingTracer("monitoring.bin", every=1)
+    start_tracer(tracer)
+    install_monitoring(tracer, Inventory)
+    inventory = Inventory()
+    inventory.add("사과", 3)
+    inventory.add("사과", 2)
+    uninstall_monitoring()
+    stop_tracer(tracer)
+    for ts, name, body in read_trace(tracer.path, tracer.functions):
+        print(f"{name}: {body[:60]}")
+
+
+print("Example 17")
+import contextlib
+import timeit
+
+def workload(d):
+    for i in range(1_000):
+        d[i] = i
+        d[i]
+
+def measure(factory):
+    return timeit.timeit(lambda: workload(factory()), number=3) / 3
+
+baseline = measure(dict)
+with contextlib.redirect_stdout(io.StringIO()):
+    print_time = measure(TraceDict)
+print(f"일반 dict:          {baseline * 1e3:7.2f}ms")
+print(f"TraceMeta(print):   {print_time * 1e3:7.2f}ms")
+
+for every, label in [(0, "0%"), (100, "1%"), (1, "100%")]:
+    tracer = SamplingTracer(f"bench_{every}.bin", every=every)
+    start_tracer(tracer)
+
+    class BenchTraceDict(
+        dict, metaclass=SamplingTraceMeta, tracer=tracer
+    ):
+        pass
+
+    sampled_time = measure(BenchTraceDict)
+    stop_tracer(tracer)
+    print(f"샘플링 {label:>4}:        {sampled_time * 1e3:7.2f}ms")
@@ -185,3 +185,178 @@ except subprocess.TimeoutExpired:
     proc.wait()
 
 print("종료 상태", proc.poll())
+
+
+print("Example 12")
+import asyncio
+import sys
+
+ENCRYPT_ARGS = ["openssl", "enc", "-des3", "-pbkdf2", "-pass", "env:password"]
+HASH_ARGS = ["openssl", "dgst", "-sha256", "-binary"]
+
+class PipelineRunner:
+    def __init__(self, stages, limit=8, timeout=10, env=None):
+        self.stages = stages  # 단계마다 실행할 명령줄 리스트
+        self.limit = limit
+        self.timeout = timeout
+        self.env = env
+        self.running = 0
+        self.peak = 0
+
+    async def spawn(self, argv, stdin, stdout):
+        proc = await asyncio.create_subprocess_exec(
+            *argv, stdin=stdin, stdout=stdout, env=self.env
+        )
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        return proc
+
+    async def run_one(self, data):
+        procs = []
+        stdin = asyncio.subprocess.PIPE
+        try:
+            for i, argv in enumerate(self.stages):
+                if i == len(self.stages) - 1:
+                    read_fd, write_fd = None, asyncio.subprocess.PIPE
+                else:
+                    read_fd, write_fd = os.pipe()
+                try:
+                    proc = await self.spawn(argv, stdin, write_fd)
+                except BaseException:
+                    if read_fd is not None:
+                        os.close(read_fd)  # 실패하면 다음 단계도 없음
+                    raise
+                finally:
+                    # 부모는 파이프 끝을 닫아 다음 단계가 EOF를 받게 함
+                    if isinstance(stdin, int) and stdin >= 0:
+                        os.close(stdin)
+                    if read_fd is not None:
+                        os.close(write_fd)
+                procs.append(proc)
+                stdin = read_fd
+
+            async def feed():
+                procs[0].stdin.write(data)
+                await procs[0].stdin.drain()
+                procs[0].stdin.close()
+
+            async def communicate():
+                # stdout을 닫고도 계속 실행되는 단계가 있으므로
+                # 종료 대기까지 제한 시간 안에 포함함
+                _, out = await asyncio.gather(
+                    feed(), procs[-1].stdout.read()
+                )
+                await asyncio.gather(*(proc.wait() for proc in procs))
+                return out
+
+            out = await asyncio.wait_for(communicate(), self.timeout)
+            for proc, argv in zip(procs, self.stages):
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, argv)
+            return out
+        finally:
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                self.running -= 1
+
+    async def run(self, inputs):
+        # 작업자 limit개가 같은 이터레이터에서 입력을 하나씩 꺼내므로
+        # 입력 전체를 코루틴으로 미리 만들지 않고 흘려보내며 처리함
+        items = enumerate(inputs)
+        results = {}
+
+        async def worker():
+            for index, data in items:
+                results[index] = await self.run_one(data)
+
+        await asyncio.gather(*(worker() for _ in range(self.limit)))
+        return [results[index] for index in range(len(results))]
+
+
+print("Example 13")
+env = os.environ.copy()
+env["password"] = "zf7ShyBhZOraQDdE/FiZpm/m/8f9X+M1"
+runner = PipelineRunner([ENCRYPT_ARGS, HASH_ARGS], limit=2, env=env)
+outputs = asyncio.run(runner.run([os.urandom(100) for _ in range(3)]))
+for out in outputs:
+    print(out[-10:])
+print("최대 동시 프로세스 수:", runner.peak)
+
+timeout_runner = PipelineRunner([["sleep", "10"]], timeout=0.1)
+try:
+    asyncio.run(timeout_runner.run([b""]))
+except TimeoutError:
+    pass  # 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+def open_fd_count():
+    if os.path.isdir("/proc/self/fd"):  # 리눅스에서만 셀 수 있음
+        return len(os.listdir("/proc/self/fd"))
+    return None
+
+# 출력을 닫은 뒤에도 계속 실행되는 단계도 제한 시간에 걸림
+lingering_runner = PipelineRunner(
+    [[sys.executable, "-c", "import os, time; os.close(1); time.sleep(10)"]],
+    timeout=0.5,
+)
+try:
+    asyncio.run(lingering_runner.run([b""]))
+except TimeoutError:
+    pass  # 이 문장이 실행되리라 예상함
+else:
+    assert False
+
+failing_stage = ["sh", "-c", "cat > /dev/null; exit 3"]
+failing_runner = PipelineRunner([["cat"], failing_stage])
+try:
+    asyncio.run(failing_runner.run([b"data"]))
+except subprocess.CalledProcessError as e:
+    assert e.cmd == failing_stage  # 실패한 단계의 명령줄을 알려줌
+    assert e.returncode == 3
+else:
+    assert False
+
+fd_count = open_fd_count()
+broken_runner = PipelineRunner([["cat"], ["존재하지 않는 명령"]])
+for _ in range(3):
+    try:
+        asyncio.run(broken_runner.run([b"data"]))
+    except FileNotFoundError:
+        pass  # 두 번째 단계를 시작하지 못해도 파이프를 닫음
+    else:
+        assert False
+assert open_fd_count() == fd_count
+
+
+print("Example 14")
+payloads = [os.urandom(100) for _ in range(100)]
+
+start = time.perf_counter()
+encrypt_procs = []
+hash_procs = []
+for data in payloads:
+    encrypt_proc = run_encrypt(data)
+    encrypt_procs.append(encrypt_proc)
+    hash_proc = run_hash(encrypt_proc.stdout)
+    hash_procs.append(hash_proc)
+    encrypt_proc.stdout.close()
+    encrypt_proc.stdout = None
+naive_peak = len(encrypt_procs) + len(hash_procs)
+for proc in encrypt_procs:
+    proc.communicate()
+for proc in hash_procs:
+    proc.communicate()
+naive_time = time.perf_counter() - start
+
+runner = PipelineRunner([ENCRYPT_ARGS, HASH_ARGS], limit=8, env=env)
+start = time.perf_counter()
+asyncio.run(runner.run(payloads))
+runner_time = time.perf_counter() - start
+
+print(f"단순 루프: {len(payloads) / naive_time:6.1f} 작업/초, "
+      f"최대 프로세스 {naive_peak}개")
+print(f"실행기:    {len(payloads) / runner_time:6.1f} 작업/초, "
+      f"최대 프로세스 {runner.peak}개")
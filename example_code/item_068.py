@@ -144,3 +144,182 @@ for thread in threads:
 end = time.perf_counter()
 delta = end - start
 print(f"{delta:.3f} 초 걸림")
+
+
+print("Example 10")
+import math
+import random
+
+_primes = [2]
+_sieve_limit = 2
+
+def primes_up_to(limit):
+    # 체로 구한 소수를 호출 사이에 캐시하고, 필요할 때만 범위를 늘림
+    global _primes, _sieve_limit
+    if limit > _sieve_limit:
+        limit = max(limit, _sieve_limit * 2)
+        sieve = bytearray([1]) * (limit + 1)
+        sieve[0:2] = b"\x00\x00"
+        for i in range(2, math.isqrt(limit) + 1):
+            if sieve[i]:
+                sieve[i * i :: i] = bytes(len(range(i * i, limit + 1, i)))
+        _primes = [i for i, is_prime in enumerate(sieve) if is_prime]
+        _sieve_limit = limit
+    return _primes
+
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+# 위 기저들로 결정적인 판정이 증명된 상한 (이 수 자체는 합성수)
+MR_DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+MR_RANDOM_ROUNDS = 40  # 상한을 넘으면 합성수를 놓칠 확률이 4**-40 이하
+
+def _is_strong_probable_prime(n, a, d, s):
+    x = pow(a, d, n)
+    if x in (1, n - 1):
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def is_prime(n):
+    # MR_DETERMINISTIC_LIMIT 미만에서는 결정적인 밀러-라빈 판정이고,
+    # 그보다 크면 무작위 기저를 더 시도하는 확률적 판정임
+    if n < 2:
+        return False
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MR_BASES:
+        if not _is_strong_probable_prime(n, a, d, s):
+            return False
+    if n >= MR_DETERMINISTIC_LIMIT:
+        for _ in range(MR_RANDOM_ROUNDS):
+            a = random.randrange(2, n - 1)
+            if not _is_strong_probable_prime(n, a, d, s):
+                return False
+    return True
+
+def pollard_rho(n):
+    # 브렌트(Brent) 변형: n의 자명하지 않은 약수 하나를 찾음
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+TRIAL_LIMIT = 1_000
+
+def prime_factors(number):
+    if number < 1:
+        raise ValueError(f"양의 정수만 소인수분해할 수 있음: {number}")
+    factors = {}
+    limit = min(math.isqrt(number), TRIAL_LIMIT)
+    for p in primes_up_to(limit):
+        if p > limit:
+            break
+        while number % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            number //= p
+        if p * p > number:
+            break
+    pending = [number] if number > 1 else []
+    while pending:
+        n = pending.pop()
+        if n < TRIAL_LIMIT**2 or is_prime(n):
+            # 시도 나눗셈이 끝난 뒤 TRIAL_LIMIT**2보다 작게 남은 수는 소수임
+            factors[n] = factors.get(n, 0) + 1
+        else:
+            d = pollard_rho(n)
+            pending.extend((d, n // d))
+    return factors
+
+def fast_factorize(number):
+    if number < 1:
+        return  # factorize처럼 0이나 음수에는 약수를 내놓지 않음
+    divisors = [1]
+    for p, exponent in prime_factors(number).items():
+        divisors = [d * p**e for d in divisors for e in range(exponent + 1)]
+    yield from sorted(divisors)
+
+
+print("Example 11")
+for number in numbers[:3] + [2**61 - 1, 600851475143, 10**18 + 9]:
+    factors = prime_factors(number)
+    print(number, factors)
+for number in numbers + [-12, 0, 1]:
+    assert list(fast_factorize(number)) == list(factorize(number))
+
+# 고정 기저 12개를 모두 통과하는 가장 작은 합성수도 올바르게 분해함
+pseudoprime = MR_DETERMINISTIC_LIMIT
+assert not is_prime(pseudoprime)
+factors = prime_factors(pseudoprime)
+print(pseudoprime, factors)
+assert math.prod(p**e for p, e in factors.items()) == pseudoprime
+assert len(list(fast_factorize(pseudoprime))) > 2
+
+
+print("Example 12")
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+def factorize_chunk(chunk):
+    return [list(fast_factorize(number)) for number in chunk]
+
+def factorize_batch(numbers, executor=None, chunksize=1000):
+    chunks = [
+        numbers[i : i + chunksize]
+        for i in range(0, len(numbers), chunksize)
+    ]
+    if executor is None:
+        results = map(factorize_chunk, chunks)
+    else:
+        results = executor.map(factorize_chunk, chunks)
+    return [divisors for chunk in results for divisors in chunk]
+
+
+print("Example 13")
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:.3f} 초 걸림")
+    return result
+
+# Example 2(직렬)와 Example 5(스레드)에서 잰 factorize 시간과 비교함
+timed("fast_factorize 직렬", lambda: factorize_batch(numbers))
+
+random_numbers = [random.randrange(2, 10**12) for _ in range(20_000)]
+serial = timed("무작위 2만 개 직렬", lambda: factorize_batch(random_numbers))
+
+if "fork" in multiprocessing.get_all_start_methods():
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(mp_context=context) as pool:
+        parallel = timed(
+            "무작위 2만 개 프로세스 풀",
+            lambda: factorize_batch(random_numbers, pool),
+        )
+    assert parallel == serial
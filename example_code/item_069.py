@@ -153,3 +153,138 @@ for thread in threads:
 
 expected = how_many * sensor_count
 print(f"카운터 값은 {expected}이어야 하며, 실제로 {counter} 임")
+
+
+print("Example 8")
+import threading
+
+class CounterShard:
+    # 한 스레드만 쓰므로 락이 필요 없음
+    __slots__ = ("value", "pending", "flush_every")
+
+    def __init__(self, flush_every):
+        self.value = 0    # 다른 스레드가 읽을 수 있게 공개한 값
+        self.pending = 0  # 아직 공개하지 않은 값
+        self.flush_every = flush_every
+
+    def add(self, amount):
+        self.pending += amount
+        if self.pending >= self.flush_every:
+            self.value += self.pending
+            self.pending = 0
+
+    def flush(self):
+        self.value += self.pending
+        self.pending = 0
+
+class ShardedCounter:
+    def __init__(self, flush_every=1):
+        self.flush_every = flush_every
+        self.shards = []
+        self.shards_lock = Lock()  # 샤드를 등록할 때만 씀
+        self.local = threading.local()
+        self.checkpoint_barrier = None
+
+    def shard(self):
+        try:
+            return self.local.shard
+        except AttributeError:
+            shard = CounterShard(self.flush_every)
+            with self.shards_lock:
+                self.shards.append(shard)
+            self.local.shard = shard
+            return shard
+
+    def read_approximate(self):
+        # 각 스레드가 마지막으로 공개한 값의 합 (flush_every만큼 늦을 수 있음)
+        return sum(shard.value for shard in self.shards)
+
+    def prepare_checkpoint(self, writer_count):
+        self.checkpoint_barrier = Barrier(writer_count + 1)
+
+    def checkpoint(self):
+        # 작성자 스레드: 값을 공개한 뒤 읽기가 끝날 때까지 멈춤
+        self.shard().flush()
+        self.checkpoint_barrier.wait()
+        self.checkpoint_barrier.wait()
+
+    def read_exact(self):
+        # 모든 작성자가 checkpoint()에 멈춰 있는 동안 읽음
+        self.checkpoint_barrier.wait()
+        try:
+            return self.read_approximate()
+        finally:
+            self.checkpoint_barrier.wait()
+
+
+print("Example 9")
+def sharded_worker(sensor_index, how_many, sharded):
+    shard = sharded.shard()
+    BARRIER.wait()
+    for i in range(how_many):
+        data = read_sensor(sensor_index)
+        shard.add(get_offset(data))
+        if i == how_many // 2:
+            sharded.checkpoint()
+    shard.flush()
+
+sharded = ShardedCounter(flush_every=1000)
+sharded.prepare_checkpoint(sensor_count)
+BARRIER = Barrier(sensor_count)
+threads = [
+    Thread(target=sharded_worker, args=(i, how_many, sharded))
+    for i in range(sensor_count)
+]
+for thread in threads:
+    thread.start()
+
+middle = sharded.read_exact()
+print(f"중간 지점의 정확한 값: {middle}")
+assert middle == (how_many // 2 + 1) * sensor_count
+
+for thread in threads:
+    thread.join()
+
+total = sharded.read_approximate()
+print(f"카운터 값은 {expected}이어야 하며, 실제로 {total} 임")
+assert total == expected
+
+
+print("Example 10")
+import sys
+import time
+
+def run_sensors(target, sensor_count, *args):
+    global BARRIER
+    BARRIER = Barrier(sensor_count)
+    threads = [
+        Thread(target=target, args=(i, bench_how_many) + args)
+        for i in range(sensor_count)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+def plain_sharded_worker(sensor_index, how_many, sharded):
+    shard = sharded.shard()
+    BARRIER.wait()
+    for _ in range(how_many):
+        data = read_sensor(sensor_index)
+        shard.add(get_offset(data))
+    shard.flush()
+
+gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+print("GIL 사용 여부:", gil_enabled)
+bench_how_many = 5 * 10**4
+for sensor_count in (4, 16, 64):
+    counter = 0
+    lock_time = run_sensors(locking_worker, sensor_count)
+    assert counter == bench_how_many * sensor_count
+    sharded = ShardedCounter(flush_every=1000)
+    shard_time = run_sensors(plain_sharded_worker, sensor_count, sharded)
+    assert sharded.read_approximate() == bench_how_many * sensor_count
+    print(f"센서 {sensor_count:2}개: 전역 락 {lock_time:.3f}초, "
+          f"샤드 {shard_time:.3f}초")
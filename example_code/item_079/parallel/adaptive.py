@@ -0,0 +1,158 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# 작업 하나를 프로세스로 보내고 결과를 받는 데 드는 대략적인 고정 비용과
+# 피클 바이트당 비용(초)
+PROCESS_TASK_OVERHEAD = 100e-6
+PROCESS_BYTE_COST = 5e-9
+# 전체 예상 시간이 이보다 짧으면 병렬화하지 않음
+SERIAL_BUDGET = 5e-3
+# 청크 하나가 대략 이 정도 시간을 쓰도록 chunksize를 정함
+TARGET_CHUNK_TIME = 20e-3
+
+
+class Profile:
+    # 함수마다 한 번 잰 비용. 입력 개수와 무관하므로 캐시해 둠
+    def __init__(self, per_task, cpu_ratio, pickled_size):
+        self.per_task = per_task
+        self.cpu_ratio = cpu_ratio
+        self.pickled_size = pickled_size
+
+    def __repr__(self):
+        if self.pickled_size is None:
+            pickled = "불가"
+        else:
+            pickled = f"{self.pickled_size}B"
+        return (
+            f"Profile(per_task={self.per_task * 1e6:.0f}us, "
+            f"cpu_ratio={self.cpu_ratio:.2f}, pickled={pickled})"
+        )
+
+
+class Decision:
+    def __init__(self, mode, chunksize, profile):
+        self.mode = mode
+        self.chunksize = chunksize
+        self.profile = profile
+
+    def __repr__(self):
+        return (
+            f"Decision({self.mode}, chunksize={self.chunksize}, "
+            f"{self.profile})"
+        )
+
+
+class AdaptiveExecutor:
+    def __init__(self, max_workers=8, sample_size=4):
+        self.max_workers = max_workers
+        self.sample_size = sample_size
+        self.cpu_count = os.cpu_count() or 1
+        self.profiles = {}  # 함수 -> Profile
+        self.thread_pool = None
+        self.process_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self):
+        for pool in (self.thread_pool, self.process_pool):
+            if pool is not None:
+                pool.shutdown()
+        self.thread_pool = self.process_pool = None
+
+    def _threads(self):
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(self.max_workers)
+        return self.thread_pool
+
+    def _processes(self):
+        if self.process_pool is None:
+            workers = min(self.max_workers, self.cpu_count)
+            self.process_pool = ProcessPoolExecutor(workers)
+        return self.process_pool
+
+    def _measure(self, func, sample):
+        # 앞쪽 몇 개를 직렬로 실행해 비용을 재고, 결과는 그대로 씀
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        results = [func(item) for item in sample]
+        cpu = time.thread_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        try:
+            pickled_size = len(pickle.dumps((func, sample[0], results[0])))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            pickled_size = None  # 람다나 클로저는 프로세스로 보낼 수 없음
+        profile = Profile(
+            wall / len(sample), cpu / wall if wall else 1.0, pickled_size
+        )
+        return profile, results
+
+    def decide(self, func, count):
+        # 모드와 chunksize는 호출마다 입력 개수에 맞춰 다시 계산함
+        profile = self.profiles[func]
+        per_task = profile.per_task
+        if per_task * count < SERIAL_BUDGET:
+            mode = "serial"
+        elif profile.cpu_ratio < 0.5:
+            mode = "threads"  # 대부분 대기하므로 GIL이 문제가 되지 않음
+        elif profile.pickled_size is None:
+            mode = "serial"
+        else:
+            ipc_cost = (
+                PROCESS_TASK_OVERHEAD
+                + profile.pickled_size * PROCESS_BYTE_COST
+            )
+            if self.cpu_count > 1 and per_task > ipc_cost:
+                mode = "processes"
+            else:
+                mode = "serial"
+
+        chunksize = max(1, math.ceil(TARGET_CHUNK_TIME / max(per_task, 1e-9)))
+        # 작업자마다 최소 몇 개의 청크가 돌아가도록 상한을 둠
+        chunksize = min(chunksize, max(1, count // (self.max_workers * 4)))
+        return Decision(mode, chunksize, profile)
+
+    def map(self, func, items):
+        items = list(items)
+        results = []
+        if func not in self.profiles:
+            sample = items[: self.sample_size]
+            if not sample:
+                return results
+            self.profiles[func], results = self._measure(func, sample)
+            items = items[len(sample) :]
+
+        decision = self.decide(func, len(items))
+        if decision.mode == "serial":
+            results.extend(map(func, items))
+        elif decision.mode == "threads":
+            results.extend(self._threads().map(func, items))
+        else:
+            results.extend(
+                self._processes().map(
+                    func, items, chunksize=decision.chunksize
+                )
+            )
+        return results
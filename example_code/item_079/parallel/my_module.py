@@ -21,3 +21,74 @@ def gcd(pair):
         if a % i == 0 and b % i == 0:
             return i
     raise RuntimeError("이 줄은 실행되지 않음")
+
+
+# 빠른 GCD 알고리즘과 일괄 처리 API
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def euclid_gcd(pair):
+    a, b = pair
+    while b:
+        a, b = b, a % b
+    return a
+
+def binary_gcd(pair):
+    # 스타인(Stein) 알고리즘: 나눗셈 대신 시프트와 뺄셈만 씀
+    a, b = pair
+    if a == 0 or b == 0:
+        return a | b
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+def math_gcd(pair):
+    return math.gcd(*pair)
+
+def gcd_chunk(pairs):
+    # 쌍마다 파이썬 함수를 호출하지 않고 map으로 C 수준에서 처리함
+    return list(map(math.gcd, [a for a, _ in pairs], [b for _, b in pairs]))
+
+# 이보다 작은 일괄 작업은 프로세스 간 통신 비용을 상쇄하지 못함
+PARALLEL_THRESHOLD = 200_000
+
+def numpy_gcd(pairs):
+    # 64비트 정수 배열로 바꿀 수 있을 때만 numpy.gcd로 한 번에 처리하고,
+    # 그 밖의 경우(2**63을 넘는 수, 실수, 빈 입력)에는 None을 반환함
+    try:
+        array = numpy.asarray(pairs)
+    except (OverflowError, ValueError):
+        return None
+    if (
+        array.dtype.kind not in "iu"
+        or array.ndim != 2
+        or array.shape[1] != 2
+    ):
+        return None
+    return numpy.gcd(array[:, 0], array[:, 1]).tolist()
+
+def gcd_batch(pairs, executor=None, chunksize=50_000):
+    # NumPy가 있으면 한 프로세스 안에서 벡터화해 처리하므로 executor와
+    # PARALLEL_THRESHOLD는 NumPy로 처리할 수 없는 입력에만 쓰임
+    if numpy is not None:
+        results = numpy_gcd(pairs)
+        if results is not None:
+            return results
+    if executor is None or len(pairs) < PARALLEL_THRESHOLD:
+        return gcd_chunk(pairs)
+    chunks = [
+        pairs[i : i + chunksize] for i in range(0, len(pairs), chunksize)
+    ]
+    results = []
+    for chunk_result in executor.map(gcd_chunk, chunks):
+        results.extend(chunk_result)
+    return results
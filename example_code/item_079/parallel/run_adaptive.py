@@ -0,0 +1,75 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import adaptive
+import my_module
+import random
+import time
+
+def wait_for_io(pair):
+    time.sleep(0.01)  # 네트워크 요청을 흉내 냄
+    return pair[0]
+
+def main():
+    rand = random.Random(1234)
+    cpu_pairs = [
+        (rand.randrange(10**4, 10**5), rand.randrange(10**4, 10**5))
+        for _ in range(200)
+    ]
+    io_pairs = cpu_pairs[:100]
+    def make_waiter(delay):
+        def wait(pair):  # 클로저는 피클할 수 없으므로 스레드나 직렬로만 실행함
+            time.sleep(delay)
+            return pair[1]
+        return wait
+
+    tasks = [
+        ("countdown gcd", my_module.gcd, cpu_pairs),
+        ("math.gcd", my_module.math_gcd, cpu_pairs),
+        ("I/O 대기", wait_for_io, io_pairs),
+        ("클로저 I/O", make_waiter(0.01), io_pairs),
+        ("람다", lambda pair: pair[0] * pair[1], cpu_pairs),
+    ]
+
+    with adaptive.AdaptiveExecutor(max_workers=8) as executor:
+        for name, func, items in tasks:
+            start = time.perf_counter()
+            expected = list(map(func, items))
+            serial = time.perf_counter() - start
+
+            for run in ("첫 호출", "캐시됨"):
+                start = time.perf_counter()
+                results = executor.map(func, items)
+                delta = time.perf_counter() - start
+                assert results == expected
+                print(f"{name:<14} {run}: 직렬 {serial:.3f}초, "
+                      f"적응형 {delta:.3f}초")
+            print("  ", executor.decide(func, len(items)))
+
+        # 처음에 적은 입력으로 잰 비용을 캐시해도, 입력이 많아지면
+        # 모드와 chunksize를 다시 정함
+        small = executor.decide(my_module.gcd, 4)
+        large = executor.decide(my_module.gcd, 10**6)
+        print("   4개:", small)
+        print("   10**6개:", large)
+        assert small.chunksize <= large.chunksize
+
+        # 피클할 수 없는 함수는 입력이 많아도 프로세스로 보내지 않음
+        unpicklable = tasks[-1][1]
+        assert executor.decide(unpicklable, 10**6).mode != "processes"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import my_module
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import time
+
+NUMBERS = [
+    (19633090, 22659730),
+    (20306770, 38141720),
+    (15516450, 22296200),
+    (20390450, 20208020),
+    (18237120, 19249280),
+    (22931290, 10204910),
+    (12812380, 22737820),
+    (38238120, 42372810),
+    (38127410, 47291390),
+    (12923910, 21238110),
+]
+
+ALGORITHMS = {
+    "countdown": my_module.gcd,
+    "euclid": my_module.euclid_gcd,
+    "binary": my_module.binary_gcd,
+    "math.gcd": my_module.math_gcd,
+}
+
+def make_batch(size):
+    if size == len(NUMBERS):
+        return NUMBERS
+    rand = random.Random(1234)
+    return [
+        (rand.randrange(10**7, 5 * 10**7), rand.randrange(10**7, 5 * 10**7))
+        for _ in range(size)
+    ]
+
+def run_map(executor, func, batch):
+    if executor is None:
+        return list(map(func, batch))
+    chunksize = max(1, len(batch) // 32)
+    return list(executor.map(func, batch, chunksize=chunksize))
+
+def main():
+    # 카운트다운 방식은 실행기마다 10초 이상 걸리므로 요청할 때만 잼
+    with_countdown = "--with-countdown" in sys.argv
+    executors = {
+        "serial": None,
+        "threads": ThreadPoolExecutor(max_workers=8),
+        "processes": ProcessPoolExecutor(max_workers=8),
+    }
+    print(f"{'알고리즘':<10} {'실행기':<10} {'크기':>8} {'시간':>9}")
+    for size in (len(NUMBERS), 10_000, 200_000):
+        batch = make_batch(size)
+        expected = None
+        for name, func in ALGORITHMS.items():
+            if name == "countdown" and (
+                not with_countdown or size > len(NUMBERS)
+            ):
+                continue
+            for executor_name, executor in executors.items():
+                start = time.perf_counter()
+                results = run_map(executor, func, batch)
+                delta = time.perf_counter() - start
+                expected = expected or results
+                assert results == expected
+                print(f"{name:<10} {executor_name:<10} {size:>8} "
+                      f"{delta:8.3f}초")
+        for executor_name, executor in executors.items():
+            start = time.perf_counter()
+            results = my_module.gcd_batch(batch, executor)
+            delta = time.perf_counter() - start
+            assert results == expected
+            print(f"{'gcd_batch':<10} {executor_name:<10} {size:>8} "
+                  f"{delta:8.3f}초")
+    for executor in executors.values():
+        if executor is not None:
+            executor.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -147,3 +147,134 @@ stats = Stats(profiler, stream=STDOUT)
 stats.strip_dirs()
 stats.sort_stats("cumulative")
 stats.print_callees()
+
+
+print("Example 12")
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+class SamplingProfiler:
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()  # "바깥;...;안쪽" -> 샘플 수
+        self.sample_time = 0.0   # 샘플링 자체에 쓴 시간
+        self.started = None
+        self.elapsed = 0.0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self.stop_event.clear()
+        self.started = time.perf_counter()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+        self.elapsed += time.perf_counter() - self.started
+
+    def run(self):
+        own_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            before = time.perf_counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.stacks[self.fold(frame)] += 1
+            self.sample_time += time.perf_counter() - before
+
+    @staticmethod
+    def fold(frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            filename = os.path.basename(code.co_filename)
+            names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def overhead(self):
+        return self.sample_time / self.elapsed if self.elapsed else 0.0
+
+    def write_folded(self, f):
+        # flamegraph.pl이나 speedscope가 읽을 수 있는 접힌 스택 형식
+        for stack, count in self.stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+print("Example 13")
+def function_stats(profiler):
+    self_counts = Counter()
+    total_counts = Counter()
+    callers = {}  # 함수 -> Counter(호출자 -> 샘플 수)
+    callees = {}  # 함수 -> Counter(호출된 함수 -> 샘플 수)
+    for stack, count in profiler.stacks.items():
+        frames = stack.split(";")
+        self_counts[frames[-1]] += count
+        for name in set(frames):
+            total_counts[name] += count
+        for caller, callee in zip(frames, frames[1:]):
+            callers.setdefault(callee, Counter())[caller] += count
+            callees.setdefault(caller, Counter())[callee] += count
+    return self_counts, total_counts, callers, callees
+
+def print_sampled_stats(profiler, limit=5):
+    self_counts, total_counts, _, _ = function_stats(profiler)
+    total = sum(profiler.stacks.values())
+    print(f"{total} 샘플, 오버헤드 {profiler.overhead():.2%}")
+    print(f"{'self':>6} {'cumul':>6}  함수")
+    for name, count in total_counts.most_common(limit):
+        self_share = self_counts[name] / total
+        print(f"{self_share:6.1%} {count / total:6.1%}  {name}")
+
+def print_sampled_callers(profiler, function_name):
+    _, _, callers, _ = function_stats(profiler)
+    for callee, counter in callers.items():
+        if callee.startswith(function_name + " "):
+            for caller, count in counter.most_common():
+                print(f"{callee} <- {caller}: {count}")
+
+def print_sampled_callees(profiler, function_name):
+    _, _, _, callees = function_stats(profiler)
+    for caller, counter in callees.items():
+        if caller.startswith(function_name + " "):
+            for callee, count in counter.most_common():
+                print(f"{caller} -> {callee}: {count}")
+
+
+print("Example 14")
+with SamplingProfiler() as sampler:
+    for _ in range(10):
+        my_program()
+
+print_sampled_stats(sampler)
+print_sampled_callers(sampler, "my_utility")
+print_sampled_callees(sampler, "first_func")
+with open("profile.folded", "w") as f:
+    sampler.write_folded(f)
+
+self_counts, total_counts, callers, callees = function_stats(sampler)
+hottest = self_counts.most_common(1)[0][0]
+assert hottest.startswith("my_utility ")
+def cumulative(prefix):
+    return sum(
+        count for name, count in total_counts.items()
+        if name.startswith(prefix)
+    )
+
+assert cumulative("first_func ") > cumulative("second_func ")
+first_callees = next(
+    counter for caller, counter in callees.items()
+    if caller.startswith("first_func ")
+)
+assert any(name.startswith("my_utility ") for name in first_callees)
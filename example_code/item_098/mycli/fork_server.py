@@ -0,0 +1,99 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# fork_server.py
+import json
+import os
+import socket
+import sys
+
+import mycli  # adjust, enhance, parser를 미리 임포트하고 PARSER를 만들어 둠
+from fork_socket import SOCKET_PATH, ensure_private_dir, is_same_user
+
+def run_child(conn, request, fds):
+    # 자식 프로세스: 클라이언트의 표준 입출력을 이어받아 main()을 실행함
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.chdir(request["cwd"])
+    sys.argv = request["argv"]
+    mycli.parser.PARSER.prog = os.path.basename(sys.argv[0])
+    try:
+        mycli.main()
+        code = 0
+    except SystemExit as e:  # argparse 오류나 --help
+        # 인터프리터처럼 None은 0, 문자열은 stderr에 출력한 뒤 1로 처리함
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        sys.excepthook(*sys.exc_info())
+        code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    conn.sendall(f"{code}\n".encode())
+    os._exit(code)
+
+def reap_children():
+    try:
+        while os.waitpid(-1, os.WNOHANG)[0]:
+            pass
+    except ChildProcessError:
+        pass
+
+def serve(path=SOCKET_PATH):
+    ensure_private_dir(os.path.dirname(path))
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(128)
+    print(f"fork 서버 대기 중: {path}", flush=True)
+    while True:
+        conn, _ = server.accept()
+        if not is_same_user(conn):
+            conn.close()  # 다른 사용자의 요청은 받지 않음
+            continue
+        fds = []
+        try:
+            message, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+            request = json.loads(message)
+            if len(fds) != 3 or not isinstance(request.get("argv"), list):
+                raise ValueError("잘못된 요청")
+        except (OSError, ValueError, AttributeError) as e:
+            # 잘못된 요청 하나 때문에 상주 서버가 죽지 않도록 이 연결만 닫음
+            print(f"요청 무시: {e!r}", file=sys.stderr, flush=True)
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+            continue
+        if os.fork() == 0:
+            server.close()
+            try:
+                run_child(conn, request, fds)
+            finally:
+                os._exit(1)  # 자식이 예외로 서버 루프에 돌아가지 않게 함
+        for fd in fds:
+            os.close(fd)
+        conn.close()
+        reap_children()
+
+if __name__ == "__main__":
+    serve()
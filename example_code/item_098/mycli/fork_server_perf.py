@@ -0,0 +1,56 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# fork_server_perf.py
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ARGS = ["photo.jpg", "adjust", "--brightness", "1.5", "--contrast", "0.5"]
+
+def measure(script, env, trials):
+    argv = [sys.executable, os.path.join(HERE, script)] + ARGS
+    timings = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        subprocess.run(argv, check=True, stdout=subprocess.DEVNULL, env=env)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def main():
+    env = dict(os.environ)
+    env["MYCLI_SOCKET"] = os.path.join(tempfile.mkdtemp(), "mycli.sock")
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "fork_server.py")],
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    try:
+        server.stdout.readline()  # 서버가 대기 상태가 될 때까지 기다림
+        cold = measure("mycli.py", env, trials=3)
+        warm = measure("mycli_client.py", env, trials=20)
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"일반 실행:    {cold * 1e3:8.1f}ms/호출")
+    print(f"fork 서버:    {warm * 1e3:8.1f}ms/호출")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# fork_socket.py
+# fork 서버와 클라이언트가 함께 쓰는 소켓 경로와 권한 검사
+import os
+import socket
+import stat
+import struct
+import tempfile
+
+def default_socket_dir():
+    # 공유 임시 디렉터리에 고정된 이름을 쓰면 다른 사용자가 먼저 소켓을
+    # 만들어 표준 입출력을 가로챌 수 있으므로 사용자 전용 디렉터리를 씀
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "mycli")
+    return os.path.join(tempfile.gettempdir(), f"mycli-{os.getuid()}")
+
+SOCKET_PATH = os.environ.get(
+    "MYCLI_SOCKET", os.path.join(default_socket_dir(), "mycli.sock")
+)
+
+def ensure_private_dir(path):
+    # 디렉터리가 없으면 0700으로 만들고, 있으면 내 소유이며 다른 사용자가
+    # 접근할 수 없는지 확인함
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"디렉터리가 아님: {path}")
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"다른 사용자가 접근할 수 있는 디렉터리: {path}")
+
+def check_private_dir(path):
+    try:
+        ensure_private_dir(path)
+    except OSError:
+        return False
+    return True
+
+def peer_uid(sock):
+    # SO_PEERCRED를 지원하지 않는 플랫폼에서는 None을 반환함
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, option, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+def is_same_user(sock):
+    uid = peer_uid(sock)
+    return uid is None or uid == os.getuid()
@@ -0,0 +1,95 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# lazy.py
+import importlib.abc
+import importlib.util
+import sys
+import time
+
+IMPORT_TIMES = []  # (모듈 이름, 자체 시간, 누적 시간)
+_active = []       # 실행 중인 모듈 임포트의 자식 시간 누적값
+
+
+class TimingLoader(importlib.abc.Loader):
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        _active.append(0.0)
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = _active.pop()
+            if _active:
+                _active[-1] += cumulative
+            IMPORT_TIMES.append(
+                (module.__name__, cumulative - children, cumulative)
+            )
+
+
+class TimingFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = TimingLoader(spec.loader)
+        return spec
+
+
+def install_import_timer():
+    if not any(isinstance(f, TimingFinder) for f in sys.meta_path):
+        sys.meta_path.insert(0, TimingFinder())
+
+
+def print_import_report(file=sys.stderr):
+    # -X importtime과 같은 형식(마이크로초)
+    print("import time: self [us] | cumulative | imported package", file=file)
+    for name, self_time, cumulative in IMPORT_TIMES:
+        print(
+            f"import time: {self_time * 1e6:9.0f} | "
+            f"{cumulative * 1e6:10.0f} | {name}",
+            file=file,
+        )
+
+
+def lazy_import(name):
+    # 모듈 객체는 바로 돌려주고, 실제 실행은 처음 속성에 접근할 때 함
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
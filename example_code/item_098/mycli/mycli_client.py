@@ -0,0 +1,56 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# mycli_client.py
+# 가벼운 모듈만 임포트해서 인터프리터 시작 비용 말고는 거의 들지 않음
+import json
+import os
+import socket
+import sys
+
+from fork_socket import SOCKET_PATH, check_private_dir, is_same_user
+
+def main():
+    request = {"argv": ["mycli"] + sys.argv[1:], "cwd": os.getcwd()}
+    sock = None
+    if check_private_dir(os.path.dirname(SOCKET_PATH)):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(SOCKET_PATH)
+        except OSError:
+            sock.close()
+            sock = None
+        else:
+            if not is_same_user(sock):
+                # 다른 사용자가 띄운 서버에는 파일 디스크립터를 넘기지 않음
+                sock.close()
+                sock = None
+    if sock is None:
+        # 서버가 없으면 평소처럼 직접 실행함
+        import mycli
+
+        sys.argv = request["argv"]
+        return mycli.main()
+
+    with sock:
+        message = json.dumps(request).encode()
+        socket.send_fds(sock, [message], [0, 1, 2])
+        sock.shutdown(socket.SHUT_WR)
+        reply = sock.makefile().read()
+    sys.exit(int(reply or 1))
+
+if __name__ == "__main__":
+    main()
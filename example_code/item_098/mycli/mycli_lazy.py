@@ -0,0 +1,43 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# mycli_lazy.py
+import atexit
+import os
+
+import lazy
+
+if os.environ.get("MYCLI_IMPORT_REPORT"):
+    lazy.install_import_timer()
+    atexit.register(lazy.print_import_report)
+
+import parser
+
+adjust = lazy.lazy_import("adjust")    # 처음 사용할 때 로드됨
+enhance = lazy.lazy_import("enhance")  # 처음 사용할 때 로드됨
+
+def main():
+    args = parser.PARSER.parse_args()
+
+    if args.command == "enhance":
+        enhance.do_enhance(args.file, args.amount)
+    elif args.command == "adjust":
+        adjust.do_adjust(args.file, args.brightness, args.contrast)
+    else:
+        raise RuntimeError("도달하지 못함")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# startup_perf.py
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "adjust": ["adjust", "--brightness", "1.5", "--contrast", "0.5"],
+    "enhance": ["enhance", "--amount", "0.3"],
+}
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def measure(script, command, trials=3):
+    argv = [sys.executable, os.path.join(HERE, script), "photo.jpg"]
+    argv += COMMANDS[command]
+    timings = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        subprocess.run(argv, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+for command in COMMANDS:
+    before = measure("mycli.py", command)
+    after = measure("mycli_lazy.py", command)
+    print(f"mycli {command:<8} 이전 {before:.3f}초, 이후 {after:.3f}초")
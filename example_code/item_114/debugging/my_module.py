@@ -32,3 +32,94 @@ def compute_variance(data):
 def compute_stddev(data):
     variance = compute_variance(data)
     return math.sqrt(variance)
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from array import array
+from collections import deque
+from itertools import islice
+
+
+class RunningVariance:
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2  # 평균과의 차이를 제곱한 값의 합
+
+    def add(self, x):
+        # 웰포드(Welford) 알고리즘: 한 번만 훑으면서도 수치적으로 안정적임
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def add_chunk(self, data):
+        self.merge(chunk_variance(data))
+
+    def merge(self, other):
+        # 찬(Chan)의 병렬 알고리즘으로 두 상태를 합침
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        return self
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            raise ValueError(f"분산을 구하려면 샘플이 2개 이상 필요함: {self.count}개")
+        return self.m2 / (self.count - 1)
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+
+def chunk_variance(data):
+    # 메모리에 올라온 청크는 C로 구현된 sum/map으로 두 번 훑는 편이 빠름
+    if numpy is not None and isinstance(data, numpy.ndarray):
+        mean = float(data.mean())
+        m2 = float(((data - mean) ** 2).sum())
+        return RunningVariance(int(data.size), mean, m2)
+    count = len(data)
+    if not count:
+        return RunningVariance()
+    mean = math.fsum(data) / count
+    m2 = math.fsum(map(squared_error, data, [mean] * count))
+    return RunningVariance(count, mean, m2)
+
+
+def compute_variance_streaming(iterable, chunk_size=65536):
+    state = RunningVariance()
+    it = iter(iterable)
+    while chunk := array("d", islice(it, chunk_size)):
+        state.add_chunk(chunk)
+    return state.variance
+
+
+def compute_variance_parallel(chunks, executor, max_pending=8):
+    # executor.map은 입력을 모두 미리 제출하므로, 제출한 청크 수를
+    # 제한해 메모리에 max_pending개 청크만 올라오게 함
+    state = RunningVariance()
+    pending = deque()
+    for chunk in chunks:
+        if len(pending) >= max_pending:
+            state.merge(pending.popleft().result())
+        pending.append(executor.submit(chunk_variance, chunk))
+    while pending:
+        state.merge(pending.popleft().result())
+    return state.variance
+
+
+def compute_stddev_streaming(iterable):
+    return math.sqrt(compute_variance_streaming(iterable))
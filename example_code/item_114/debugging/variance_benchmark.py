@@ -0,0 +1,101 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import random
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import my_module
+
+
+def sensor_stream(count, seed=1234):
+    rand = random.Random(seed)
+    for _ in range(count):
+        yield 1e9 + rand.gauss(0, 1)  # 큰 오프셋은 두 번 훑는 방식을 시험함
+
+
+def chunked(count, chunk_size=1_000_000):
+    stream = sensor_stream(count)
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        yield array("d", (next(stream) for _ in range(size)))
+
+
+def drain(iterable):
+    deque(iterable, maxlen=0)
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    result = func()
+    delta = time.perf_counter() - start
+    line = f"{label:<12} {count / delta:14,.0f} 샘플/초"
+    if result is not None:
+        line += f"  분산={result:.6f}"
+    print(line)
+    return result
+
+
+# 두 번 훑는 기준 구현은 데이터를 모두 메모리에 올려야 하므로 작은 크기에서만 잼
+TWO_PASS_LIMIT = 2_000_000
+
+
+def main():
+    # 10**9 샘플을 재려면 인자로 1000000000을 넘기면 됨
+    # 웰포드와 프로세스 풀 경로는 스트림을 청크 단위로만 메모리에 올림
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    # 스트리밍 경로의 시간에는 샘플 생성 비용이 들어 있으므로 따로 잼
+    timed("생성만", lambda: drain(sensor_stream(count)), count)
+    streaming = timed(
+        "웰포드",
+        lambda: my_module.compute_variance_streaming(sensor_stream(count)),
+        count,
+    )
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        parallel = timed(
+            "프로세스 풀",
+            lambda: my_module.compute_variance_parallel(chunked(count), pool),
+            count,
+        )
+    assert math.isclose(streaming, parallel, rel_tol=1e-6)
+
+    if count <= TWO_PASS_LIMIT:
+        data = list(sensor_stream(count))
+        expected = timed(
+            "두 번 훑기", lambda: my_module.compute_variance(data), count
+        )
+        assert math.isclose(expected, streaming, rel_tol=1e-6)
+        assert math.isclose(
+            my_module.compute_stddev(data),
+            my_module.compute_stddev_streaming(data),
+            rel_tol=1e-6,
+        )
+
+    try:
+        my_module.compute_variance_streaming([])
+    except ValueError:
+        pass  # 빈 스트림은 compute_variance처럼 실패해야 함
+    else:
+        assert False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import sys
+from collections import Counter, deque
+
+
+class Census:
+    def __init__(self, counts, sizes):
+        self.counts = counts  # 타입 -> 객체 수
+        self.sizes = sizes    # 타입 -> 추정 크기(바이트)
+
+    def top(self, limit=10):
+        return [
+            (kind, self.counts[kind], size)
+            for kind, size in self.sizes.most_common(limit)
+        ]
+
+    def diff(self, before, limit=10):
+        count_delta = Counter(self.counts)
+        count_delta.subtract(before.counts)
+        size_delta = Counter(self.sizes)
+        size_delta.subtract(before.sizes)
+        ranked = sorted(
+            size_delta.items(), key=lambda item: item[1], reverse=True
+        )
+        return [
+            (kind, count_delta[kind], size)
+            for kind, size in ranked[:limit]
+            if size or count_delta[kind]
+        ]
+
+
+SINGLETONS = (None, True, False, Ellipsis, NotImplemented, (), "", b"")
+
+
+def _make_is_shared():
+    # 인터프리터 전체가 공유하는 객체는 특정 소유자에게 크기를 물리지 않음
+    singleton_ids = frozenset(map(id, SINGLETONS))
+    is_immortal = getattr(sys, "_is_immortal", None)  # 3.14 이상
+    is_interned = getattr(sys, "_is_interned", None)  # 3.13 이상
+
+    def is_shared(obj):
+        if id(obj) in singleton_ids:
+            return True
+        if is_immortal is not None and is_immortal(obj):
+            return True
+        kind = type(obj)
+        if kind is int:
+            return -5 <= obj <= 256  # CPython이 미리 만들어 둔 작은 정수
+        if kind is str:
+            if is_interned is not None:
+                return is_interned(obj)
+            # 이전 버전에서는 식별자 모양의 문자열이 대부분 인터닝됨
+            return obj.isidentifier()
+        return False
+
+    return is_shared
+
+
+def take_census(deep=False):
+    objects = gc.get_objects()
+    counts = Counter(map(type, objects))  # 개수 세기는 C 수준에서 처리함
+    sizes = Counter()
+    getsizeof = sys.getsizeof
+    if not deep:
+        for obj in objects:
+            sizes[type(obj)] += getsizeof(obj)
+    else:
+        # GC가 추적하지 않는 bytes, str 같은 참조 대상은 get_objects에
+        # 나타나지 않으므로 그 크기를 처음 만난 소유 객체의 타입에 더함.
+        # 여러 객체가 공유하는 참조 대상은 한 번만 셈
+        is_tracked = gc.is_tracked
+        get_referents = gc.get_referents
+        is_shared = _make_is_shared()
+        seen = set()
+        for obj in objects:
+            size = getsizeof(obj)
+            for child in get_referents(obj):
+                if is_tracked(child):
+                    continue
+                child_id = id(child)
+                if child_id in seen:
+                    continue
+                seen.add(child_id)
+                if not is_shared(child):
+                    size += getsizeof(child)
+            sizes[type(obj)] += size
+        del seen
+    del objects
+    return Census(counts, sizes)
+
+
+def find_path(predicate, roots=None, max_depth=10):
+    # 루트에서 시작해 참조를 너비 우선으로 따라가며 처음 만나는 대상까지의
+    # 경로를 반환함. get_referrers와 달리 힙을 한 번만 훑는다
+    if roots is None:
+        roots = [sys.modules]
+    parents = {id(root): None for root in roots}
+    keep_alive = list(roots)
+    queue = deque((root, 0) for root in roots)
+    while queue:
+        obj, depth = queue.popleft()
+        if predicate(obj):
+            path = [obj]
+            parent = parents[id(obj)]
+            while parent is not None:
+                path.append(parent)
+                parent = parents[id(parent)]
+            return path[::-1]
+        if depth == max_depth:
+            continue
+        for child in gc.get_referents(obj):
+            if id(child) not in parents:
+                parents[id(child)] = obj
+                keep_alive.append(child)
+                queue.append((child, depth + 1))
+    return None
+
+
+def describe_path(path):
+    lines = []
+    for parent, child in zip(path, path[1:]):
+        label = type(child).__name__
+        if isinstance(parent, dict):
+            for key, value in parent.items():
+                if value is child:
+                    label = f"[{key!r}] -> {label}"
+                    break
+        elif isinstance(parent, (list, tuple)):
+            for index, value in enumerate(parent):
+                if value is child:
+                    label = f"[{index}] -> {label}"
+                    break
+        lines.append(label)
+    return " ".join([type(path[0]).__name__] + lines)
@@ -0,0 +1,41 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import sys
+import time
+
+import census
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+class Node:
+    def __init__(self, value):
+        self.value = value
+
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+heap = [Node(str(i)) for i in range(count)]  # 10**7로 실행하면 수 GB를 씀
+
+print("객체 수:         ", len(gc.get_objects()))
+print(f"get_objects만:    {timed(gc.get_objects):.3f}초")
+print(f"얕은 인구 조사:   {timed(census.take_census):.3f}초")
+print(f"깊은 인구 조사:   {timed(lambda: census.take_census(deep=True)):.3f}초")
@@ -0,0 +1,35 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sampler
+
+profiler = sampler.AllocationSampler(interval=0.05)
+profiler.start()
+
+import waste_memory
+
+hold_references = []
+for _ in range(5):
+    hold_references.append(waste_memory.run())  # 디버깅할 코드
+    profiler.sample_continuous()
+
+profiler.stop()
+
+top = profiler.top_growth(3, since_start=True)
+for traceback, size, count in top:
+    print(f"{traceback}: {size / 1024:+.0f} KiB, {count:+} 개")
+
+assert "waste_memory.py" in str(top[0][0])
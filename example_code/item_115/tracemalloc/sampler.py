@@ -0,0 +1,166 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+)
+
+
+class AllocationSampler:
+    def __init__(
+        self,
+        interval=1.0,        # 스냅샷 간격(초)
+        key_type="lineno",   # "lineno" 또는 "traceback"
+        nframe=10,
+        history=10,          # 보관할 차이(diff)의 최대 개수
+        duty_cycle=None,     # 예: 0.05면 간격의 5% 동안만 추적함
+                             # 1%일 때 샘플러 스레드의 CPU는 실행 시간의
+                             # 1% 미만이고, 추적 안 함과 번갈아 잰 차이는
+                             # 몇 퍼센트임. 단발 측정은 기계 부하 때문에
+                             # ±20%까지 흔들림 (sampler_overhead.py 참고)
+        dump_path=None,
+        top_n=10,
+    ):
+        self.interval = interval
+        self.key_type = key_type
+        self.nframe = nframe
+        self.history = deque(maxlen=history)
+        self.duty_cycle = duty_cycle
+        self.dump_path = dump_path
+        self.top_n = top_n
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.started_tracing = False
+        self.baseline = None
+        self.previous = None
+        self.cpu_time = 0.0  # 샘플링 모드에서 이 스레드가 쓴 CPU 시간(초)
+        self.sampled = {}  # 샘플링 모드: 키 -> [누적 증가 크기, 개수]
+
+    def take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(IGNORED)
+
+    def start(self):
+        if self.duty_cycle is None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.nframe)
+                self.started_tracing = True
+            self.baseline = self.previous = self.take_snapshot()
+            target = self.run_continuous
+        else:
+            target = self.run_sampled
+        self.thread = threading.Thread(target=target, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def run_continuous(self):
+        while not self.stop_event.wait(self.interval):
+            self.sample_continuous()
+
+    def sample_continuous(self):
+        # 백그라운드 스레드와 직접 호출이 겹칠 수 있으므로 스냅샷도 락 안에서
+        # 찍어야 previous가 과거로 돌아가 음수 차이가 생기지 않음
+        with self.lock:
+            snapshot = self.take_snapshot()
+            # 직전 스냅샷과만 비교하므로 비교 비용이 전체 기록에 비례하지 않음
+            diff = snapshot.compare_to(self.previous, self.key_type)
+            self.history.append((time.time(), diff))
+            self.previous = snapshot
+        self.dump()
+
+    def run_sampled(self):
+        active = self.interval * self.duty_cycle
+        idle = self.interval - active
+        empty = tracemalloc.Snapshot((), self.nframe)
+        while not self.stop_event.wait(idle):
+            cpu_start = time.thread_time()
+            # tracemalloc은 추적하는 동안만 비용이 드므로 짧은 구간만 켬.
+            # 호스트가 이미 추적 중이면 끄지 않고 구간 앞뒤를 비교함
+            owned = not tracemalloc.is_tracing()
+            if owned:
+                tracemalloc.start(self.nframe)
+                before = empty  # 구간 전에 할당한 메모리는 추적되지 않음
+            else:
+                before = self.take_snapshot()
+            self.stop_event.wait(active)
+            if owned:
+                # 구간 동안 이 스레드는 대기만 하므로 필터 없이 바로 씀
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+            else:
+                after = self.take_snapshot()
+            self.record_sample(after.compare_to(before, self.key_type))
+            self.dump()
+            # 샘플러 스레드가 직접 쓴 CPU 시간. 추적 중 다른 스레드의 할당이
+            # 느려지는 비용은 들어 있지 않음
+            self.cpu_time += time.thread_time() - cpu_start
+
+    def record_sample(self, stats):
+        # 구간마다의 증가량(구간 중에 할당해 끝날 때까지 살아 있는 크기)을
+        # 위치별로 누적하므로 top_growth는 두 모드 모두 증가량을 보고함
+        with self.lock:
+            for stat in stats:
+                entry = self.sampled.setdefault(stat.traceback, [0, 0])
+                entry[0] += stat.size_diff
+                entry[1] += stat.count_diff
+            self.history.append((time.time(), stats))
+
+    def top_growth(self, limit=None, since_start=False):
+        limit = limit or self.top_n
+        with self.lock:
+            if self.duty_cycle is not None:
+                ranked = sorted(
+                    self.sampled.items(),
+                    key=lambda item: item[1][0],
+                    reverse=True,
+                )
+                return [
+                    (traceback, size, count)
+                    for traceback, (size, count) in ranked[:limit]
+                ]
+            if since_start:
+                stats = self.previous.compare_to(
+                    self.baseline, self.key_type
+                )
+            elif self.history:
+                stats = self.history[-1][1]
+            else:
+                return []
+        return [
+            (stat.traceback, stat.size_diff, stat.count_diff)
+            for stat in stats[:limit]
+        ]
+
+    def dump(self):
+        if self.dump_path is None:
+            return
+        with open(self.dump_path, "a") as f:
+            f.write(f"--- {time.ctime()}\n")
+            for traceback, size, count in self.top_growth():
+                f.write(f"{traceback}: {size:+} B, {count:+} 개\n")
@@ -0,0 +1,74 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import tracemalloc
+
+import sampler
+import waste_memory
+
+
+def measure(rounds=50):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        waste_memory.run()
+    return time.perf_counter() - start
+
+
+def median(values):
+    return sorted(values)[len(values) // 2]
+
+
+# 기계 부하가 시간에 따라 바뀌므로 추적 안 함과 샘플링을 번갈아 재고,
+# 바로 앞의 추적 안 함 측정과의 비율을 구해 그 중앙값을 씀. 따로 잰
+# 중앙값끼리 비교하면 부하 변화 때문에 -10%~+20%까지 흔들림
+trials = 7
+baselines = []
+ratios = []
+sampler_cpu = []
+for _ in range(trials):
+    baselines.append(measure())
+    profiler = sampler.AllocationSampler(
+        interval=0.5, duty_cycle=0.01, nframe=1
+    )
+    profiler.start()
+    elapsed = measure()
+    profiler.stop()
+    ratios.append(elapsed / baselines[-1])
+    sampler_cpu.append(profiler.cpu_time / elapsed)
+baseline = median(baselines)
+sampled = baseline * median(ratios)
+
+tracemalloc.start(10)
+full = measure()
+tracemalloc.stop()
+
+print(f"추적 안 함:     {baseline:.3f}초")
+print(f"전체 추적:      {full:.3f}초 ({full / baseline - 1:+.0%})")
+print(f"1% 샘플링:      {sampled:.3f}초 ({sampled / baseline - 1:+.0%})")
+print(f"샘플러 스레드 CPU: 실행 시간의 {median(sampler_cpu):.1%}")
+
+top = profiler.top_growth(1)
+print("가장 많이 늘어난 곳:", top[0][0] if top else "샘플 없음")
+
+# 이미 추적 중인 호스트에서 쓰면 구간 앞뒤를 비교하고 추적을 끄지 않음
+tracemalloc.start()
+hosted = sampler.AllocationSampler(interval=0.05, duty_cycle=0.5)
+hosted.start()
+hold_references = [waste_memory.run() for _ in range(3)]
+hosted.stop()
+assert tracemalloc.is_tracing()
+tracemalloc.stop()
@@ -0,0 +1,32 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import census
+
+before = census.take_census(deep=True)
+
+import waste_memory
+
+hold_reference = waste_memory.run()
+
+after = census.take_census(deep=True)
+for kind, count, size in after.diff(before, limit=3):
+    print(f"{kind.__name__:>10}: {count:+} 개, {size / 1024:+.0f} KiB")
+
+path = census.find_path(
+    lambda obj: isinstance(obj, waste_memory.MyObject)
+)
+print("참조 경로:", census.describe_path(path))